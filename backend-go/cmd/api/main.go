@@ -25,6 +25,7 @@ import (
 	"github.com/everest-an/dchat-backend/internal/response"
 	"github.com/everest-an/dchat-backend/pkg/utils"
 	"github.com/gin-gonic/gin"
+	"github.com/google/uuid"
 )
 
 func main() {
@@ -37,6 +38,10 @@ func main() {
 	// Initialize structured logger.
 	log := logger.New(cfg.Log.Level, cfg.Log.Format)
 
+	// Draw UUID randomness from crypto/rand in batches rather than one read
+	// per ID (request IDs, temporary upload names).
+	uuid.EnableRandPool()
+
 	// Initialize database.
 	db, err := database.New(&cfg.Database, log)
 	if err != nil {
@@ -60,24 +65,9 @@ func main() {
 	nonceStore := auth.NewNonceStore(redis, cfg.Web3.NonceExpiry)
 
 	// Auto-migrate new models.
-	db.DB.AutoMigrate(
-		&models.Report{}, &models.AuditLog{}, &models.SystemSetting{},
-		&models.Group{}, &models.GroupMember{}, &models.GroupAnnouncement{},
-		&models.GroupMessage{}, &models.GroupJoinRequest{},
-		&models.Mention{},
-		&models.Meeting{},
-		&models.PinnedConversation{},
-		&models.Ticket{}, &models.TicketMessage{},
-		&models.Task{}, &models.CalendarEvent{}, &models.EventParticipant{},
-		&models.DeviceToken{}, &models.NotificationPreference{},
-		&models.SSOProvider{}, &models.SSOSession{},
-		&models.Proposal{}, &models.Vote{}, &models.TreasuryTransaction{},
-		&models.CRMContact{}, &models.CRMDeal{}, &models.CRMActivity{},
-		&models.Bot{}, &models.BotEvent{},
-		&models.UserSkill{}, &models.UserProject{}, &models.UserResource{},
-		&models.UserSeeking{}, &models.UserBusiness{},
-		&models.FriendRequest{}, &models.Friendship{},
-	)
+	if err := db.DB.AutoMigrate(models.All()...); err != nil {
+		log.Error("failed to auto-migrate models", "error", err)
+	}
 
 	// Initialize handlers.
 	authHandler := handlers.NewAuthHandler(userService, jwtService, web3Service, nonceStore, log)
@@ -154,11 +144,15 @@ func main() {
 	router.Use(response.RequestIDMiddleware())
 	router.Use(middleware.CORSMiddleware(&cfg.CORS))
 
-	// Health check.
+	// Health check. The database is pinged in the background so probes are
+	// served from the last result instead of taking a pool connection.
+	healthCtx, stopHealth := context.WithCancel(context.Background())
+	defer stopHealth()
+	go db.MonitorHealth(healthCtx, 5*time.Second, log)
+
 	router.GET("/health", func(c *gin.Context) {
-		dbErr := db.Ping()
 		status := "ok"
-		if dbErr != nil {
+		if !db.Healthy() {
 			status = "degraded"
 		}
 		response.OK(c, gin.H{
@@ -5,11 +5,15 @@ set -e
 echo "🚀 dChat Go Backend Deployment Script"
 echo "======================================"
 
-# Colors
-GREEN='\033[0;32m'
-YELLOW='\033[1;33m'
-RED='\033[0;31m'
-NC='\033[0m' # No Color
+# Colors (only when writing to a terminal, so CI logs stay plain)
+if [ -t 1 ]; then
+    GREEN='\033[0;32m'
+    YELLOW='\033[1;33m'
+    RED='\033[0;31m'
+    NC='\033[0m' # No Color
+else
+    GREEN='' YELLOW='' RED='' NC=''
+fi
 
 # Configuration
 API_PORT=8080
@@ -9,6 +9,7 @@ import (
 	"time"
 
 	"github.com/everest-an/dchat-backend/internal/config"
+	"github.com/everest-an/dchat-backend/internal/httpclient"
 )
 
 // Client is a generic LLM API client supporting OpenAI-compatible endpoints.
@@ -37,9 +38,7 @@ func NewClient(cfg *config.AIConfig) *Client {
 		model:     cfg.Model,
 		maxTokens: cfg.MaxTokens,
 		baseURL:   baseURL,
-		http: &http.Client{
-			Timeout: 60 * time.Second,
-		},
+		http:      httpclient.New(60 * time.Second),
 	}
 }
 
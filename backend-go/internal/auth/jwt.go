@@ -28,14 +28,17 @@ func NewJWTService(cfg *config.JWTConfig) *JWTService {
 }
 
 func (s *JWTService) GenerateToken(userID uint, walletAddress string, role string) (string, error) {
+	// Read the clock once so iat, nbf and exp are derived from the same instant.
+	now := time.Now()
+	issued := jwt.NewNumericDate(now)
 	claims := Claims{
 		UserID:        userID,
 		WalletAddress: walletAddress,
 		Role:          role,
 		RegisteredClaims: jwt.RegisteredClaims{
-			ExpiresAt: jwt.NewNumericDate(time.Now().Add(time.Hour * time.Duration(s.expirationHours))),
-			IssuedAt:  jwt.NewNumericDate(time.Now()),
-			NotBefore: jwt.NewNumericDate(time.Now()),
+			ExpiresAt: jwt.NewNumericDate(now.Add(time.Hour * time.Duration(s.expirationHours))),
+			IssuedAt:  issued,
+			NotBefore: issued,
 		},
 	}
 
@@ -53,8 +53,9 @@ func (s *Web3Service) VerifySignature(walletAddress, message, signature string)
 	// Get address from public key
 	recoveredAddress := crypto.PubkeyToAddress(*pubKey)
 
-	// Compare addresses (case-insensitive)
-	return strings.EqualFold(address.Hex(), recoveredAddress.Hex()), nil
+	// Compare the raw 20-byte addresses; Hex() would compute an EIP-55
+	// checksum (a keccak256) for each side only to compare case-insensitively.
+	return address == recoveredAddress, nil
 }
 
 // hashMessage creates an Ethereum signed message hash
@@ -1,8 +1,11 @@
 package database
 
 import (
+	"context"
 	"fmt"
 	"log/slog"
+	"sync/atomic"
+	"time"
 
 	"github.com/everest-an/dchat-backend/internal/config"
 	"gorm.io/driver/postgres"
@@ -13,6 +16,8 @@ import (
 // Database wraps a GORM DB connection with lifecycle helpers.
 type Database struct {
 	DB *gorm.DB
+
+	healthy atomic.Bool
 }
 
 // New opens a PostgreSQL connection using the supplied configuration.
@@ -52,7 +57,9 @@ func New(cfg *config.DatabaseConfig, log *slog.Logger) (*Database, error) {
 		"max_idle", cfg.MaxIdleConns,
 	)
 
-	return &Database{DB: db}, nil
+	d := &Database{DB: db}
+	d.healthy.Store(true)
+	return d, nil
 }
 
 // Close releases the underlying database connection.
@@ -72,3 +79,43 @@ func (d *Database) Ping() error {
 	}
 	return sqlDB.Ping()
 }
+
+// Healthy reports the result of the most recent background ping. It never
+// touches the connection pool, so health probes stay cheap under load.
+func (d *Database) Healthy() bool {
+	return d.healthy.Load()
+}
+
+// MonitorHealth pings the database every interval and records the result
+// for Healthy. It blocks until ctx is cancelled; run it in a goroutine.
+func (d *Database) MonitorHealth(ctx context.Context, interval time.Duration, log *slog.Logger) {
+	ticker := time.NewTicker(interval)
+	defer ticker.Stop()
+
+	for {
+		select {
+		case <-ctx.Done():
+			return
+		case <-ticker.C:
+			pingCtx, cancel := context.WithTimeout(ctx, interval)
+			err := d.pingContext(pingCtx)
+			cancel()
+
+			if healthy := err == nil; d.healthy.Swap(healthy) != healthy {
+				if healthy {
+					log.Info("database connection recovered")
+				} else {
+					log.Error("database health check failed", "error", err)
+				}
+			}
+		}
+	}
+}
+
+func (d *Database) pingContext(ctx context.Context) error {
+	sqlDB, err := d.DB.DB()
+	if err != nil {
+		return err
+	}
+	return sqlDB.PingContext(ctx)
+}
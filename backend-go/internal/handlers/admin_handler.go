@@ -11,6 +11,7 @@ import (
 	"github.com/gin-gonic/gin"
 	"golang.org/x/crypto/bcrypt"
 	"gorm.io/gorm"
+	"gorm.io/gorm/clause"
 )
 
 // AdminHandler handles admin dashboard API endpoints.
@@ -560,14 +561,27 @@ func (h *AdminHandler) UpdateSettings(c *gin.Context) {
 		return
 	}
 
+	// Upsert every setting in one statement. A key repeated in the request
+	// keeps its last value, as if the updates were applied in order.
+	index := make(map[string]int, len(req.Settings))
+	settings := make([]models.SystemSetting, 0, len(req.Settings))
 	for _, s := range req.Settings {
-		var setting models.SystemSetting
-		result := h.db.Where("key = ?", s.Key).First(&setting)
-		if result.Error != nil {
-			setting = models.SystemSetting{Key: s.Key, Value: s.Value}
-			h.db.Create(&setting)
-		} else {
-			h.db.Model(&setting).Update("value", s.Value)
+		if i, ok := index[s.Key]; ok {
+			settings[i].Value = s.Value
+			continue
+		}
+		index[s.Key] = len(settings)
+		settings = append(settings, models.SystemSetting{Key: s.Key, Value: s.Value})
+	}
+	if len(settings) > 0 {
+		err := h.db.Clauses(clause.OnConflict{
+			Columns:   []clause.Column{{Name: "key"}},
+			DoUpdates: clause.AssignmentColumns([]string{"value", "updated_at"}),
+		}).Create(&settings).Error
+		if err != nil {
+			h.log.Error("failed to update settings", "error", err)
+			response.InternalError(c, "failed to update settings")
+			return
 		}
 	}
 
@@ -67,20 +67,30 @@ func (h *CalendarHandler) CreateEvent(c *gin.Context) {
 		GroupID:     req.GroupID,
 	}
 
-	if err := h.db.Create(&event).Error; err != nil {
+	// Event and participants are written in one transaction and one commit.
+	err = h.db.Transaction(func(tx *gorm.DB) error {
+		if err := tx.Create(&event).Error; err != nil {
+			return err
+		}
+
+		// Add participants in one multi-row insert. Creator is always accepted.
+		participants := []models.EventParticipant{{EventID: event.ID, UserID: userID, Status: "accepted"}}
+		seen := map[uint]bool{userID: true}
+		for _, uid := range req.Participants {
+			if seen[uid] {
+				continue
+			}
+			seen[uid] = true
+			participants = append(participants, models.EventParticipant{EventID: event.ID, UserID: uid, Status: "pending"})
+		}
+		return tx.Create(&participants).Error
+	})
+	if err != nil {
 		h.log.Error("failed to create event", "error", err)
 		response.InternalError(c, "failed to create event")
 		return
 	}
 
-	// Add participants.
-	for _, uid := range req.Participants {
-		p := models.EventParticipant{EventID: event.ID, UserID: uid, Status: "pending"}
-		h.db.Create(&p)
-	}
-	// Creator is always accepted.
-	h.db.Create(&models.EventParticipant{EventID: event.ID, UserID: userID, Status: "accepted"})
-
 	h.db.Preload("Participants.User").First(&event, event.ID)
 	response.Created(c, event)
 }
@@ -1,11 +1,19 @@
 package handlers
 
 import (
+	"crypto/hmac"
+	"crypto/rand"
+	"crypto/sha256"
+	"encoding/hex"
 	"fmt"
+	"io"
 	"log/slog"
+	"net/http"
 	"os"
 	"path/filepath"
+	"strconv"
 	"strings"
+	"sync"
 
 	"github.com/gin-gonic/gin"
 	"github.com/google/uuid"
@@ -30,26 +38,73 @@ var allowedAudioTypes = map[string]bool{
 // Allowed general file MIME type prefixes.
 var allowedFilePrefixes = []string{"image/", "audio/", "video/", "application/pdf", "text/"}
 
+// uploadBufferSize is the chunk size used to copy uploads to disk. 128 KiB
+// keeps the number of write syscalls and hash updates low for multi-MB
+// files while staying small enough to pool.
+const uploadBufferSize = 128 * 1024
+
+var uploadBufferPool = sync.Pool{
+	New: func() any {
+		buf := make([]byte, uploadBufferSize)
+		return &buf
+	},
+}
+
+// Subdirectories of the upload directory, one per file category.
+var uploadSubDirs = []string{"audio", "images", "files"}
+
+const (
+	dedupKeyFile = ".dedup_key"
+	dedupKeySize = 32
+)
+
 // FileHandler handles file upload and download.
 type FileHandler struct {
 	uploadDir string
+	subDirs   map[string]string // category subdirectory -> path under uploadDir
+	dedupKey  []byte            // nil disables dedup; files then get random names
 	maxSize   int64
 	log       *slog.Logger
 }
 
-// NewFileHandler creates a FileHandler.
+// NewFileHandler creates a FileHandler. The category subdirectories are
+// created once here rather than on every upload.
 func NewFileHandler(uploadDir string, maxSize int64, log *slog.Logger) *FileHandler {
-	// Ensure upload directory exists.
-	if err := os.MkdirAll(uploadDir, 0755); err != nil {
-		log.Error("failed to create upload directory", "error", err, "dir", uploadDir)
+	subDirs := make(map[string]string, len(uploadSubDirs))
+	for _, name := range uploadSubDirs {
+		dir := filepath.Join(uploadDir, name)
+		if err := os.MkdirAll(dir, 0755); err != nil {
+			log.Error("failed to create upload directory", "error", err, "dir", dir)
+		}
+		subDirs[name] = dir
+	}
+
+	dedupKey, err := loadDedupKey(uploadDir)
+	if err != nil {
+		// Fall back to a per-process key: files are still deduplicated until
+		// the next restart.
+		log.Error("failed to load upload dedup key", "error", err, "dir", uploadDir)
+		dedupKey = make([]byte, dedupKeySize)
+		if _, err := rand.Read(dedupKey); err != nil {
+			// A zero key would make stored names computable by anyone.
+			log.Error("upload dedup disabled: failed to generate key", "error", err)
+			dedupKey = nil
+		}
+	}
+
+	return &FileHandler{
+		uploadDir: uploadDir,
+		subDirs:   subDirs,
+		dedupKey:  dedupKey,
+		maxSize:   maxSize,
+		log:       log,
 	}
-	return &FileHandler{uploadDir: uploadDir, maxSize: maxSize, log: log}
 }
 
 // UploadFile handles file upload.
 // POST /api/files/upload
 func (h *FileHandler) UploadFile(c *gin.Context) {
-	_ = mustUserID(c) // ensure authenticated
+	userID := mustUserID(c)
 
 	file, header, err := c.Request.FormFile("file")
 	if err != nil {
@@ -69,12 +124,10 @@ func (h *FileHandler) UploadFile(c *gin.Context) {
 		return
 	}
 
-	// Generate unique filename preserving extension.
 	ext := filepath.Ext(header.Filename)
 	if ext == "" {
 		ext = guessExtension(contentType)
 	}
-	uniqueName := uuid.New().String() + ext
 
 	// Determine subdirectory by type.
 	subDir := "files"
@@ -84,31 +137,116 @@ func (h *FileHandler) UploadFile(c *gin.Context) {
 		subDir = "images"
 	}
 
-	destDir := filepath.Join(h.uploadDir, subDir)
-	if err := os.MkdirAll(destDir, 0755); err != nil {
-		h.log.Error("failed to create subdirectory", "error", err, "dir", destDir)
+	// Stream to a temporary name first; the final name depends on the hash.
+	destDir := h.subDirs[subDir]
+	tmpPath := filepath.Join(destDir, "."+uuid.New().String()+".part")
+	fileHash, err := saveAndHash(file, tmpPath)
+	if err != nil {
+		h.log.Error("failed to save file", "error", err, "path", tmpPath)
 		response.InternalError(c, "failed to save file")
 		return
 	}
 
-	destPath := filepath.Join(destDir, uniqueName)
-	if err := c.SaveUploadedFile(header, destPath); err != nil {
+	// Identical content re-uploaded by the same user (e.g. the same photo
+	// sent to several chats) maps to the same file and is stored once.
+	storedName := uuid.New().String() + ext
+	if h.dedupKey != nil {
+		storedName = h.dedupName(userID, fileHash) + ext
+	}
+	destPath := filepath.Join(destDir, storedName)
+	if _, err := os.Stat(destPath); err == nil {
+		os.Remove(tmpPath)
+	} else if err := os.Rename(tmpPath, destPath); err != nil {
+		os.Remove(tmpPath)
 		h.log.Error("failed to save file", "error", err, "path", destPath)
 		response.InternalError(c, "failed to save file")
 		return
 	}
 
 	// Return the relative URL path for the file.
-	fileURL := fmt.Sprintf("/api/files/%s/%s", subDir, uniqueName)
+	fileURL := fmt.Sprintf("/api/files/%s/%s", subDir, storedName)
 
 	response.Created(c, gin.H{
 		"file_url":  fileURL,
 		"file_name": header.Filename,
 		"file_size": header.Size,
 		"file_type": contentType,
+		"file_hash": fileHash,
 	})
 }
 
+// dedupName derives the stored file name from the uploader and the content
+// digest, keyed with the server's dedup key. Names stay unguessable and
+// nobody can probe whether some content was uploaded by a given user.
+func (h *FileHandler) dedupName(userID uint, fileHash string) string {
+	mac := hmac.New(sha256.New, h.dedupKey)
+	mac.Write([]byte(strconv.FormatUint(uint64(userID), 10)))
+	mac.Write([]byte{':'})
+	mac.Write([]byte(fileHash))
+	return hex.EncodeToString(mac.Sum(nil)[:16])
+}
+
+// loadDedupKey reads the key used to name stored files, creating it on first
+// start. It lives next to the files so the two always move together. An
+// existing key file is never replaced: that would rename every future upload.
+func loadDedupKey(uploadDir string) ([]byte, error) {
+	path := filepath.Join(uploadDir, dedupKeyFile)
+	key, err := os.ReadFile(path)
+	if err == nil {
+		if len(key) != dedupKeySize {
+			return nil, fmt.Errorf("%s: expected %d bytes, got %d", path, dedupKeySize, len(key))
+		}
+		return key, nil
+	}
+	if !os.IsNotExist(err) {
+		return nil, err
+	}
+
+	key = make([]byte, dedupKeySize)
+	if _, err := rand.Read(key); err != nil {
+		return nil, err
+	}
+	if err := os.WriteFile(path, key, 0600); err != nil {
+		return nil, err
+	}
+	return key, nil
+}
+
+// saveAndHash streams src to destPath and returns the hex SHA-256 of the
+// content. The digest is computed during the copy, so the upload is read
+// once and never held in memory as a whole.
+func saveAndHash(src io.Reader, destPath string) (string, error) {
+	out, err := os.Create(destPath)
+	if os.IsNotExist(err) {
+		// The subdirectory was removed after startup; recreate it once.
+		if err = os.MkdirAll(filepath.Dir(destPath), 0755); err == nil {
+			out, err = os.Create(destPath)
+		}
+	}
+	if err != nil {
+		return "", err
+	}
+
+	bufp := uploadBufferPool.Get().(*[]byte)
+	defer uploadBufferPool.Put(bufp)
+
+	// Hide any WriterTo on src so the copy always goes through the pooled
+	// buffer instead of a fresh 32 KiB one.
+	hasher := sha256.New()
+	reader := struct{ io.Reader }{src}
+	if _, err := io.CopyBuffer(io.MultiWriter(out, hasher), reader, *bufp); err != nil {
+		out.Close()
+		os.Remove(destPath)
+		return "", err
+	}
+	if err := out.Close(); err != nil {
+		os.Remove(destPath)
+		return "", err
+	}
+
+	return hex.EncodeToString(hasher.Sum(nil)), nil
+}
+
 // ServeFile serves an uploaded file.
 // GET /api/files/:subdir/:filename
 func (h *FileHandler) ServeFile(c *gin.Context) {
@@ -121,13 +259,36 @@ func (h *FileHandler) ServeFile(c *gin.Context) {
 		return
 	}
 
-	filePath := filepath.Join(h.uploadDir, subDir, filename)
-	if _, err := os.Stat(filePath); os.IsNotExist(err) {
+	// Only category directories are served, and never dot files: those are
+	// in-progress uploads and the dedup key.
+	dir, ok := h.subDirs[subDir]
+	if !ok || strings.HasPrefix(filename, ".") {
+		response.NotFound(c, "file not found")
+		return
+	}
+
+	// Open once and serve from the descriptor: a separate Stat before
+	// c.File resolved the path twice and raced with concurrent deletes.
+	filePath := filepath.Join(dir, filename)
+	f, err := os.Open(filePath)
+	if err != nil {
+		if os.IsNotExist(err) {
+			response.NotFound(c, "file not found")
+			return
+		}
+		h.log.Error("failed to open file", "error", err, "path", filePath)
+		response.InternalError(c, "failed to read file")
+		return
+	}
+	defer f.Close()
+
+	info, err := f.Stat()
+	if err != nil || info.IsDir() {
 		response.NotFound(c, "file not found")
 		return
 	}
 
-	c.File(filePath)
+	http.ServeContent(c.Writer, c.Request, info.Name(), info.ModTime(), f)
 }
 
 func isAllowedFileType(contentType string) bool {
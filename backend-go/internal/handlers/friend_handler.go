@@ -206,16 +206,12 @@ func (h *FriendHandler) AcceptFriendRequest(c *gin.Context) {
 			return err
 		}
 
+		// Both directions in a single multi-row INSERT.
 		friendships := []models.Friendship{
 			{UserID: friendReq.SenderID, FriendID: friendReq.ReceiverID},
 			{UserID: friendReq.ReceiverID, FriendID: friendReq.SenderID},
 		}
-		for _, f := range friendships {
-			if err := tx.Create(&f).Error; err != nil {
-				return err
-			}
-		}
-		return nil
+		return tx.Create(&friendships).Error
 	})
 
 	if err != nil {
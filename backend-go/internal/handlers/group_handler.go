@@ -476,7 +476,9 @@ func (h *GroupHandler) CreateAnnouncement(c *gin.Context) {
 	response.Created(c, announcement)
 }
 
-// GetAnnouncements lists announcements for a group.
+// GetAnnouncements lists announcements for a group, newest first. Without
+// page/page_size it returns every announcement; with either it returns one page.
+// GET /api/groups/:id/announcements[?page=&page_size=]
 func (h *GroupHandler) GetAnnouncements(c *gin.Context) {
 	groupID, err := parseUintParam(c, "id")
 	if err != nil {
@@ -484,13 +486,45 @@ func (h *GroupHandler) GetAnnouncements(c *gin.Context) {
 		return
 	}
 
+	// Callers that send no paging params get the full list, as before.
+	_, hasPage := c.GetQuery("page")
+	_, hasPageSize := c.GetQuery("page_size")
+	if !hasPage && !hasPageSize {
+		var announcements []models.GroupAnnouncement
+		if err := h.db.Where("group_id = ?", groupID).
+			Order("created_at DESC").
+			Preload("Author").
+			Find(&announcements).Error; err != nil {
+			h.log.Error("failed to list announcements", "error", err, "group", groupID)
+			response.InternalError(c, "failed to list announcements")
+			return
+		}
+		response.OK(c, announcements)
+		return
+	}
+
+	page, pageSize := parsePagination(c)
+
+	var total int64
+	if err := h.db.Model(&models.GroupAnnouncement{}).Where("group_id = ?", groupID).Count(&total).Error; err != nil {
+		h.log.Error("failed to count announcements", "error", err, "group", groupID)
+		response.InternalError(c, "failed to list announcements")
+		return
+	}
+
 	var announcements []models.GroupAnnouncement
-	h.db.Where("group_id = ?", groupID).
+	if err := h.db.Where("group_id = ?", groupID).
 		Order("created_at DESC").
+		Offset((page - 1) * pageSize).
+		Limit(pageSize).
 		Preload("Author").
-		Find(&announcements)
+		Find(&announcements).Error; err != nil {
+		h.log.Error("failed to list announcements", "error", err, "group", groupID)
+		response.InternalError(c, "failed to list announcements")
+		return
+	}
 
-	response.OK(c, announcements)
+	response.Paginated(c, announcements, total, page, pageSize)
 }
 
 // --- Join requests ---
@@ -24,6 +24,10 @@ func NewMatchingHandler(db *gorm.DB, log *slog.Logger) *MatchingHandler {
 	return &MatchingHandler{db: db, log: log}
 }
 
+// activeUserMessages is the sent-message count above which a candidate gets
+// the "Active user" bonus.
+const activeUserMessages = 10
+
 // MatchResult represents a single match recommendation.
 type MatchResult struct {
 	User       simpleUser `json:"user"`
@@ -58,9 +62,11 @@ func (h *MatchingHandler) GetRecommendations(c *gin.Context) {
 		Limit(200).Find(&candidates)
 
 	// Score each candidate.
+	mc := newMatchContext(&currentUser)
+	mc.active = h.activeUsers(candidates)
 	var results []MatchResult
 	for _, cand := range candidates {
-		score, reasons, tags := h.computeScore(&currentUser, &cand)
+		score, reasons, tags := h.computeScore(mc, &cand)
 		if score > 0 {
 			results = append(results, MatchResult{
 				User: simpleUser{
@@ -99,8 +105,34 @@ func (h *MatchingHandler) GetRecommendations(c *gin.Context) {
 	})
 }
 
-// computeScore calculates matching score between two users.
-func (h *MatchingHandler) computeScore(user, candidate *models.User) (float64, []string, []string) {
+// matchContext holds the current user's data, prepared once per request and
+// shared by every candidate's score.
+type matchContext struct {
+	user      *models.User
+	tags      []string // tags as entered, reported back as common tags
+	tagKeys   []string // lower-cased tags, aligned with tags
+	roleWords map[string]struct{}
+	active    map[uint]bool
+}
+
+func newMatchContext(user *models.User) *matchContext {
+	mc := &matchContext{user: user, tags: parseTags(user.Position)}
+	mc.tagKeys = make([]string, len(mc.tags))
+	for i, t := range mc.tags {
+		mc.tagKeys[i] = strings.ToLower(t)
+	}
+	mc.roleWords = make(map[string]struct{})
+	for _, w := range strings.Fields(strings.ToLower(user.Position)) {
+		if len(w) > 2 {
+			mc.roleWords[w] = struct{}{}
+		}
+	}
+	return mc
+}
+
+// computeScore calculates matching score between the current user and a candidate.
+func (h *MatchingHandler) computeScore(mc *matchContext, candidate *models.User) (float64, []string, []string) {
+	user := mc.user
 	var score float64
 	var reasons []string
 	var commonTags []string
@@ -115,7 +147,7 @@ func (h *MatchingHandler) computeScore(user, candidate *models.User) (float64, [
 
 	// Position/role similarity.
 	if user.Position != "" && candidate.Position != "" {
-		if containsAny(strings.ToLower(user.Position), strings.ToLower(candidate.Position)) {
+		if sharesWord(mc.roleWords, strings.ToLower(candidate.Position)) {
 			score += 2.0
 			reasons = append(reasons, "Similar role")
 		}
@@ -123,14 +155,11 @@ func (h *MatchingHandler) computeScore(user, candidate *models.User) (float64, [
 
 	// Skills/tags matching (stored in Bio field as comma-separated).
 	// Use Position field for tag-like matching (e.g. "Senior Developer, Blockchain").
-	userTags := parseTags(user.Position)
-	candTags := parseTags(candidate.Position)
-	for _, ut := range userTags {
-		for _, ct := range candTags {
-			if strings.EqualFold(ut, ct) {
-				commonTags = append(commonTags, ut)
-				score += 1.5
-			}
+	candTags := tagCounts(candidate.Position)
+	for i, key := range mc.tagKeys {
+		for n := candTags[key]; n > 0; n-- {
+			commonTags = append(commonTags, mc.tags[i])
+			score += 1.5
 		}
 	}
 	if len(commonTags) > 0 {
@@ -138,9 +167,7 @@ func (h *MatchingHandler) computeScore(user, candidate *models.User) (float64, [
 	}
 
 	// Activity bonus: users who have recent messages are more active.
-	var msgCount int64
-	h.db.Model(&models.Message{}).Where("sender_id = ?", candidate.ID).Count(&msgCount)
-	if msgCount > 10 {
+	if mc.active[candidate.ID] {
 		score += 1.0
 		reasons = append(reasons, "Active user")
 	}
@@ -151,6 +178,34 @@ func (h *MatchingHandler) computeScore(user, candidate *models.User) (float64, [
 	return score, reasons, commonTags
 }
 
+// activeUsers returns the candidates that have sent more than
+// activeUserMessages messages, counted for all candidates in one query.
+func (h *MatchingHandler) activeUsers(candidates []models.User) map[uint]bool {
+	if len(candidates) == 0 {
+		return nil
+	}
+	ids := make([]uint, len(candidates))
+	for i := range candidates {
+		ids[i] = candidates[i].ID
+	}
+
+	var activeIDs []uint
+	err := h.db.Model(&models.Message{}).
+		Where("sender_id IN ?", ids).
+		Group("sender_id").
+		Having("COUNT(*) > ?", activeUserMessages).
+		Pluck("sender_id", &activeIDs).Error
+	if err != nil {
+		h.log.Warn("failed to count candidate activity", "error", err)
+	}
+
+	active := make(map[uint]bool, len(activeIDs))
+	for _, id := range activeIDs {
+		active[id] = true
+	}
+	return active
+}
+
 // RecordFeedback records user feedback on a recommendation.
 // POST /api/matching/feedback
 func (h *MatchingHandler) RecordFeedback(c *gin.Context) {
@@ -188,14 +243,26 @@ func parseTags(bio string) []string {
 	return tags
 }
 
-func containsAny(a, b string) bool {
-	aWords := strings.Fields(a)
-	bWords := strings.Fields(b)
-	for _, aw := range aWords {
-		for _, bw := range bWords {
-			if aw == bw && len(aw) > 2 {
-				return true
-			}
+// tagCounts indexes the tags in s by their lower-cased form. Duplicates are
+// counted so scoring matches a pairwise comparison of the two tag lists.
+func tagCounts(s string) map[string]int {
+	tags := parseTags(s)
+	if len(tags) == 0 {
+		return nil
+	}
+	counts := make(map[string]int, len(tags))
+	for _, t := range tags {
+		counts[strings.ToLower(t)]++
+	}
+	return counts
+}
+
+// sharesWord reports whether any word of s is in words. Only words longer
+// than two characters are put in the set, so short words never match.
+func sharesWord(words map[string]struct{}, s string) bool {
+	for _, w := range strings.Fields(s) {
+		if _, ok := words[w]; ok {
+			return true
 		}
 	}
 	return false
@@ -0,0 +1,99 @@
+package handlers
+
+import (
+	"math"
+	"reflect"
+	"testing"
+
+	"github.com/everest-an/dchat-backend/internal/models"
+)
+
+// TestComputeScore covers each scoring rule of the matching handler.
+func TestComputeScore(t *testing.T) {
+	tests := []struct {
+		name       string
+		user       models.User
+		candidate  models.User
+		active     bool
+		wantScore  float64
+		wantReason []string
+		wantTags   []string
+	}{
+		{
+			name:      "no match",
+			user:      models.User{Position: "Designer"},
+			candidate: models.User{Position: "Accountant"},
+			wantScore: 0,
+		},
+		{
+			name:       "same company ignores case",
+			user:       models.User{Company: "Dchat Labs"},
+			candidate:  models.User{Company: "dchat labs"},
+			wantScore:  30,
+			wantReason: []string{"Same company"},
+		},
+		{
+			name:       "similar role",
+			user:       models.User{Position: "Senior Engineer"},
+			candidate:  models.User{Position: "Staff Engineer"},
+			wantScore:  20,
+			wantReason: []string{"Similar role"},
+		},
+		{
+			name:       "shared tag ignores case",
+			user:       models.User{Position: "Blockchain, Go"},
+			candidate:  models.User{Position: "go, Rust"},
+			wantScore:  15,
+			wantReason: []string{"Shared skills/interests"},
+			wantTags:   []string{"Go"},
+		},
+		{
+			name:       "duplicate candidate tags count twice",
+			user:       models.User{Position: "Blockchain, Go"},
+			candidate:  models.User{Position: "go, GO"},
+			wantScore:  30,
+			wantReason: []string{"Shared skills/interests"},
+			wantTags:   []string{"Go", "Go"},
+		},
+		{
+			name:       "active candidate",
+			user:       models.User{Position: "Designer"},
+			candidate:  models.User{ID: 7, Position: "Accountant"},
+			active:     true,
+			wantScore:  10,
+			wantReason: []string{"Active user"},
+		},
+		{
+			name:      "score is capped at 100",
+			user:      models.User{Company: "Dchat", Position: "Go, Rust, Solidity, Blockchain"},
+			candidate: models.User{ID: 7, Company: "dchat", Position: "go, rust, solidity, blockchain"},
+			active:    true,
+			wantScore: 100,
+			wantReason: []string{
+				"Same company", "Similar role", "Shared skills/interests", "Active user",
+			},
+			wantTags: []string{"Go", "Rust", "Solidity", "Blockchain"},
+		},
+	}
+
+	h := &MatchingHandler{}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			mc := newMatchContext(&tt.user)
+			if tt.active {
+				mc.active = map[uint]bool{tt.candidate.ID: true}
+			}
+
+			score, reasons, tags := h.computeScore(mc, &tt.candidate)
+			if math.Abs(score-tt.wantScore) > 1e-9 {
+				t.Errorf("expected score %v, got %v", tt.wantScore, score)
+			}
+			if !reflect.DeepEqual(reasons, tt.wantReason) {
+				t.Errorf("expected reasons %v, got %v", tt.wantReason, reasons)
+			}
+			if !reflect.DeepEqual(tags, tt.wantTags) {
+				t.Errorf("expected tags %v, got %v", tt.wantTags, tags)
+			}
+		})
+	}
+}
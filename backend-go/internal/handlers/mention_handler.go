@@ -131,14 +131,20 @@ func (h *MentionHandler) CreateMentionsForMessage(messageID, groupID uint, menti
 		return
 	}
 
-	for _, uid := range mentions {
-		mention := models.Mention{
+	if len(mentions) == 0 {
+		return
+	}
+
+	// Insert all mentions with a single multi-row INSERT.
+	records := make([]models.Mention, len(mentions))
+	for i := range mentions {
+		records[i] = models.Mention{
 			MessageID:       messageID,
 			GroupID:         groupID,
-			MentionedUserID: &uid,
-		}
-		if err := h.db.Create(&mention).Error; err != nil {
-			h.log.Error("failed to create mention", "error", err, "message", messageID, "user", uid)
+			MentionedUserID: &mentions[i],
 		}
 	}
+	if err := h.db.Create(&records).Error; err != nil {
+		h.log.Error("failed to create mentions", "error", err, "message", messageID, "users", mentions)
+	}
 }
@@ -147,35 +147,44 @@ func (h *MessageHandler) GetConversations(c *gin.Context) {
 
 	var conversations []ConversationRow
 
+	// One pass over the user's messages: each row is tagged with the
+	// conversation partner, then window functions pick the latest message and
+	// count unread rows per partner. This replaces three correlated subqueries
+	// evaluated for every message row.
 	// All parameters are the same currentUserID (uint), safe from SQL injection.
 	err := h.db.Raw(`
-		SELECT DISTINCT
-			CASE
-				WHEN m.sender_id = ? THEN m.receiver_id
-				ELSE m.sender_id
-			END AS user_id,
+		WITH convo AS (
+			SELECT
+				CASE
+					WHEN sender_id = ? THEN receiver_id
+					ELSE sender_id
+				END AS partner_id,
+				content,
+				created_at,
+				(receiver_id = ? AND read = false) AS is_unread
+			FROM message
+			WHERE sender_id = ? OR receiver_id = ?
+		), ranked AS (
+			SELECT
+				partner_id,
+				content,
+				created_at,
+				ROW_NUMBER() OVER (PARTITION BY partner_id ORDER BY created_at DESC) AS rn,
+				COUNT(*) FILTER (WHERE is_unread) OVER (PARTITION BY partner_id) AS unread
+			FROM convo
+		)
+		SELECT
+			r.partner_id AS user_id,
 			u.name,
 			u.username,
-			(SELECT content FROM message
-			 WHERE (sender_id = ? AND receiver_id = u.id)
-			    OR (sender_id = u.id AND receiver_id = ?)
-			 ORDER BY created_at DESC LIMIT 1) AS last_message,
-			(SELECT created_at FROM message
-			 WHERE (sender_id = ? AND receiver_id = u.id)
-			    OR (sender_id = u.id AND receiver_id = ?)
-			 ORDER BY created_at DESC LIMIT 1) AS timestamp,
-			(SELECT COUNT(*) FROM message
-			 WHERE sender_id = u.id AND receiver_id = ? AND read = false) AS unread
-		FROM message m
-		JOIN "user" u ON u.id = CASE
-			WHEN m.sender_id = ? THEN m.receiver_id
-			ELSE m.sender_id
-		END
-		WHERE m.sender_id = ? OR m.receiver_id = ?
-		ORDER BY timestamp DESC
-	`, currentUserID, currentUserID, currentUserID,
-		currentUserID, currentUserID, currentUserID,
-		currentUserID, currentUserID, currentUserID).
+			r.content AS last_message,
+			r.created_at AS timestamp,
+			r.unread
+		FROM ranked r
+		JOIN "user" u ON u.id = r.partner_id
+		WHERE r.rn = 1
+		ORDER BY r.created_at DESC
+	`, currentUserID, currentUserID, currentUserID, currentUserID).
 		Scan(&conversations).Error
 
 	if err != nil {
@@ -0,0 +1,36 @@
+// Package httpclient provides the outbound HTTP client shared by the
+// backend's third-party integrations.
+package httpclient
+
+import (
+	"net"
+	"net/http"
+	"time"
+)
+
+// Transport is shared by every outbound client so that keep-alive
+// connections, TLS sessions and HTTP/2 streams are pooled process-wide
+// instead of per service. The default transport only retains two idle
+// connections per host, which made concurrent calls redial.
+var Transport = &http.Transport{
+	Proxy: http.ProxyFromEnvironment,
+	DialContext: (&net.Dialer{
+		Timeout:   10 * time.Second,
+		KeepAlive: 30 * time.Second,
+	}).DialContext,
+	ForceAttemptHTTP2:     true,
+	MaxIdleConns:          128,
+	MaxIdleConnsPerHost:   32,
+	IdleConnTimeout:       90 * time.Second,
+	TLSHandshakeTimeout:   10 * time.Second,
+	ExpectContinueTimeout: 1 * time.Second,
+}
+
+// New returns a client with the given overall request timeout that uses the
+// shared Transport.
+func New(timeout time.Duration) *http.Client {
+	return &http.Client{
+		Timeout:   timeout,
+		Transport: Transport,
+	}
+}
@@ -14,11 +14,12 @@ func CORSMiddleware(cfg *config.CORSConfig) gin.HandlerFunc {
 	methods := strings.Join(cfg.AllowedMethods, ", ")
 	headers := strings.Join(cfg.AllowedHeaders, ", ")
 	maxAge := strconv.Itoa(cfg.MaxAge)
+	originAllowed := OriginMatcher(cfg.AllowedOrigins)
 
 	return func(c *gin.Context) {
 		origin := c.GetHeader("Origin")
 
-		if isOriginAllowed(origin, cfg.AllowedOrigins) {
+		if originAllowed(origin) {
 			c.Writer.Header().Set("Access-Control-Allow-Origin", origin)
 		} else if len(cfg.AllowedOrigins) == 1 && cfg.AllowedOrigins[0] == "*" {
 			c.Writer.Header().Set("Access-Control-Allow-Origin", "*")
@@ -38,11 +39,19 @@ func CORSMiddleware(cfg *config.CORSConfig) gin.HandlerFunc {
 	}
 }
 
-func isOriginAllowed(origin string, allowed []string) bool {
+// OriginMatcher returns a case-insensitive check of a request origin against
+// the allowed list. The list is folded into a set once, so each request costs
+// a single map lookup; "*" allows every origin.
+func OriginMatcher(allowed []string) func(origin string) bool {
+	set := make(map[string]struct{}, len(allowed))
 	for _, a := range allowed {
-		if a == "*" || strings.EqualFold(a, origin) {
-			return true
+		if a == "*" {
+			return func(string) bool { return true }
 		}
+		set[strings.ToLower(a)] = struct{}{}
+	}
+	return func(origin string) bool {
+		_, ok := set[strings.ToLower(origin)]
+		return ok
 	}
-	return false
 }
@@ -108,3 +108,27 @@ func TestCORS_WildcardOrigin(t *testing.T) {
 		t.Errorf("expected wildcard to allow any origin, got '%s'", origin)
 	}
 }
+
+func TestOriginMatcher(t *testing.T) {
+	tests := []struct {
+		name    string
+		allowed []string
+		origin  string
+		want    bool
+	}{
+		{"exact match", []string{"https://dchat.pro"}, "https://dchat.pro", true},
+		{"case-insensitive", []string{"https://DChat.pro"}, "https://dchat.PRO", true},
+		{"not listed", []string{"https://dchat.pro"}, "https://evil.com", false},
+		{"empty origin", []string{"https://dchat.pro"}, "", false},
+		{"wildcard", []string{"https://dchat.pro", "*"}, "https://evil.com", true},
+		{"empty list", nil, "https://dchat.pro", false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := OriginMatcher(tt.allowed)(tt.origin); got != tt.want {
+				t.Errorf("expected %v, got %v", tt.want, got)
+			}
+		})
+	}
+}
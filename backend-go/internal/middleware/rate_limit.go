@@ -43,12 +43,14 @@ func (rl *RateLimiter) Middleware() gin.HandlerFunc {
 		}
 		userID := v.(uint)
 
+		now := time.Now()
+
 		rl.mu.Lock()
 
 		// Periodically clean up stale entries.
-		if time.Since(rl.lastClean) > 5*time.Minute {
-			rl.cleanup()
-			rl.lastClean = time.Now()
+		if now.Sub(rl.lastClean) > 5*time.Minute {
+			rl.cleanup(now)
+			rl.lastClean = now
 		}
 
 		entry, ok := rl.entries[userID]
@@ -57,7 +59,6 @@ func (rl *RateLimiter) Middleware() gin.HandlerFunc {
 			rl.entries[userID] = entry
 		}
 
-		now := time.Now()
 		cutoff := now.Add(-rl.window)
 
 		// Remove timestamps outside the window.
@@ -83,9 +84,9 @@ func (rl *RateLimiter) Middleware() gin.HandlerFunc {
 	}
 }
 
-// cleanup removes entries that have no recent timestamps.
-func (rl *RateLimiter) cleanup() {
-	cutoff := time.Now().Add(-rl.window)
+// cleanup removes entries that have no recent timestamps as of now.
+func (rl *RateLimiter) cleanup(now time.Time) {
+	cutoff := now.Add(-rl.window)
 	for uid, entry := range rl.entries {
 		if len(entry.timestamps) == 0 {
 			delete(rl.entries, uid)
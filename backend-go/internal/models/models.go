@@ -0,0 +1,24 @@
+package models
+
+// All returns every model the API server auto-migrates at startup, so the
+// schema list lives next to the models instead of in main.
+func All() []interface{} {
+	return []interface{}{
+		&Report{}, &AuditLog{}, &SystemSetting{},
+		&Group{}, &GroupMember{}, &GroupAnnouncement{},
+		&GroupMessage{}, &GroupJoinRequest{},
+		&Mention{},
+		&Meeting{},
+		&PinnedConversation{},
+		&Ticket{}, &TicketMessage{},
+		&Task{}, &CalendarEvent{}, &EventParticipant{},
+		&DeviceToken{}, &NotificationPreference{},
+		&SSOProvider{}, &SSOSession{},
+		&Proposal{}, &Vote{}, &TreasuryTransaction{},
+		&CRMContact{}, &CRMDeal{}, &CRMActivity{},
+		&Bot{}, &BotEvent{},
+		&UserSkill{}, &UserProject{}, &UserResource{},
+		&UserSeeking{}, &UserBusiness{},
+		&FriendRequest{}, &Friendship{},
+	}
+}
@@ -7,6 +7,8 @@ import (
 	"log/slog"
 	"net/http"
 	"time"
+
+	"github.com/everest-an/dchat-backend/internal/httpclient"
 )
 
 // SMSConfig holds SMS provider configuration (Twilio-compatible).
@@ -28,7 +30,7 @@ func NewSMSService(cfg *SMSConfig, log *slog.Logger) *SMSService {
 	return &SMSService{
 		cfg: cfg,
 		log: log,
-		client: &http.Client{Timeout: 10 * time.Second},
+		client: httpclient.New(10 * time.Second),
 	}
 }
 
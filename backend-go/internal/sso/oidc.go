@@ -8,6 +8,8 @@ import (
 	"net/url"
 	"strings"
 	"time"
+
+	"github.com/everest-an/dchat-backend/internal/httpclient"
 )
 
 // OIDCClient handles OpenID Connect authentication flows.
@@ -18,7 +20,7 @@ type OIDCClient struct {
 // NewOIDCClient creates an OIDC client.
 func NewOIDCClient() *OIDCClient {
 	return &OIDCClient{
-		client: &http.Client{Timeout: 10 * time.Second},
+		client: httpclient.New(10 * time.Second),
 	}
 }
 
@@ -10,6 +10,7 @@ import (
 	"time"
 
 	"github.com/everest-an/dchat-backend/internal/config"
+	"github.com/everest-an/dchat-backend/internal/httpclient"
 )
 
 // Service handles audio-to-text transcription using OpenAI Whisper API.
@@ -30,9 +31,7 @@ func NewService(cfg *config.AIConfig) *Service {
 		apiKey:  cfg.APIKey,
 		baseURL: baseURL,
 		model:   "whisper-1",
-		http: &http.Client{
-			Timeout: 120 * time.Second,
-		},
+		http:    httpclient.New(120 * time.Second),
 	}
 }
 
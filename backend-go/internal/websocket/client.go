@@ -133,26 +133,30 @@ func (c *Client) WritePump() {
 }
 
 func (c *Client) SendMessage(msg *Message) error {
+	data, err := json.Marshal(msg)
+	if err != nil {
+		return err
+	}
+	c.SendRaw(data)
+	return nil
+}
+
+// SendRaw queues an already encoded message. Fan-out paths marshal once and
+// share the same buffer across recipients; it must not be modified after.
+func (c *Client) SendRaw(data []byte) {
 	c.mu.Lock()
 	defer c.mu.Unlock()
 
 	if c.isClosing {
-		return nil
-	}
-
-	data, err := json.Marshal(msg)
-	if err != nil {
-		return err
+		return
 	}
 
 	select {
 	case c.Send <- data:
-		return nil
 	default:
 		// Channel is full, close the client
 		close(c.Send)
 		c.isClosing = true
-		return nil
 	}
 }
 
@@ -1,6 +1,7 @@
 package websocket
 
 import (
+	"encoding/json"
 	"log/slog"
 	"sync"
 	"time"
@@ -42,31 +43,37 @@ func (h *Hub) Run() {
 	}
 }
 
+// registerClient and unregisterClient log after releasing h.mu so that
+// encoding and writing the log record never blocks message routing.
 func (h *Hub) registerClient(client *Client) {
 	h.mu.Lock()
-	defer h.mu.Unlock()
-
 	if old, exists := h.Clients[client.UserID]; exists {
 		old.Close()
 	}
 
 	h.Clients[client.UserID] = client
-	h.log.Info("client registered", "user_id", client.UserID, "total", len(h.Clients))
+	total := len(h.Clients)
 
 	h.broadcastStatusLocked(client.UserID, true)
+	h.mu.Unlock()
+
+	h.log.Info("client registered", "user_id", client.UserID, "total", total)
 }
 
 func (h *Hub) unregisterClient(client *Client) {
 	h.mu.Lock()
-	defer h.mu.Unlock()
-
-	if _, exists := h.Clients[client.UserID]; exists {
+	_, exists := h.Clients[client.UserID]
+	if exists {
 		delete(h.Clients, client.UserID)
 		client.Close()
-		h.log.Info("client unregistered", "user_id", client.UserID, "total", len(h.Clients))
-
 		h.broadcastStatusLocked(client.UserID, false)
 	}
+	total := len(h.Clients)
+	h.mu.Unlock()
+
+	if exists {
+		h.log.Info("client unregistered", "user_id", client.UserID, "total", total)
+	}
 }
 
 // HandleMessage dispatches a message to the correct handler by type.
@@ -306,9 +313,15 @@ func (h *Hub) broadcastStatusLocked(userID uint, online bool) {
 		},
 	}
 
+	data, err := json.Marshal(statusMsg)
+	if err != nil {
+		h.log.Error("failed to encode status message", "error", err, "user_id", userID)
+		return
+	}
+
 	for _, client := range h.Clients {
 		if client.UserID != userID {
-			client.SendMessage(statusMsg)
+			client.SendRaw(data)
 		}
 	}
 }
@@ -372,10 +385,16 @@ func (h *Hub) handleGroupChatMessage(client *Client, msg *Message) {
 		Data:      dbMsg,
 	}
 
+	data, err := json.Marshal(outMsg)
+	if err != nil {
+		h.log.Error("failed to encode group message", "error", err, "group", msg.GroupID)
+		return
+	}
+
 	h.mu.RLock()
 	for _, uid := range memberIDs {
 		if c, online := h.Clients[uid]; online {
-			c.SendMessage(outMsg)
+			c.SendRaw(data)
 		}
 	}
 	h.mu.RUnlock()
@@ -398,11 +417,17 @@ func (h *Hub) handleGroupTypingIndicator(client *Client, msg *Message) {
 		Timestamp: time.Now(),
 	}
 
+	data, err := json.Marshal(outMsg)
+	if err != nil {
+		h.log.Error("failed to encode group typing", "error", err, "group", msg.GroupID)
+		return
+	}
+
 	h.mu.RLock()
 	for _, uid := range memberIDs {
 		if uid != client.UserID {
 			if c, online := h.Clients[uid]; online {
-				c.SendMessage(outMsg)
+				c.SendRaw(data)
 			}
 		}
 	}
@@ -1,6 +1,8 @@
 -- Migration: Create user_verifications table for Privado ID integration
 -- Created: 2026-01-06
 
+BEGIN;
+
 -- Create user_verifications table
 CREATE TABLE IF NOT EXISTS user_verifications (
     id SERIAL PRIMARY KEY,
@@ -41,3 +43,5 @@ COMMENT ON COLUMN user_verifications.issuer_did IS 'Decentralized Identifier (DI
 COMMENT ON COLUMN user_verifications.proof_data IS 'JSON data containing the zero-knowledge proof';
 COMMENT ON COLUMN user_verifications.status IS 'Status of the verification: active, expired, revoked';
 COMMENT ON COLUMN user_verifications.metadata IS 'Additional metadata about the verification';
+
+COMMIT;
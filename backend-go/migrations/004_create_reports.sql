@@ -1,6 +1,8 @@
 -- Migration: Create report table for user reporting and content moderation
 -- Created: 2026-02-18
 
+BEGIN;
+
 CREATE TABLE IF NOT EXISTS report (
     id SERIAL PRIMARY KEY,
     reporter_id INTEGER NOT NULL,
@@ -35,3 +37,5 @@ CREATE INDEX idx_report_deleted_at ON report(deleted_at) WHERE deleted_at IS NOT
 COMMENT ON TABLE report IS 'Stores user-submitted reports for content moderation';
 COMMENT ON COLUMN report.reason IS 'Report reason: spam, harassment, inappropriate, fraud, other';
 COMMENT ON COLUMN report.status IS 'Report lifecycle status: pending, reviewing, resolved, dismissed';
+
+COMMIT;
@@ -1,6 +1,8 @@
 -- Migration: Create group-related tables
 -- Created: 2026-02-18
 
+BEGIN;
+
 -- Groups table
 CREATE TABLE IF NOT EXISTS "group" (
     id SERIAL PRIMARY KEY,
@@ -96,3 +98,5 @@ COMMENT ON TABLE group_member IS 'Group membership with roles: owner, admin, mem
 COMMENT ON TABLE group_announcement IS 'Pinned announcements within groups';
 COMMENT ON TABLE group_message IS 'Messages sent within group chats';
 COMMENT ON TABLE group_join_request IS 'Pending requests to join groups that require approval';
+
+COMMIT;
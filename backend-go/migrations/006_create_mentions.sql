@@ -1,3 +1,5 @@
+BEGIN;
+
 -- Create mentions table for @mention tracking
 CREATE TABLE IF NOT EXISTS mention (
     id              SERIAL PRIMARY KEY,
@@ -13,3 +15,5 @@ CREATE INDEX idx_mention_mentioned_user ON mention(mentioned_user_id);
 CREATE INDEX idx_mention_group ON mention(group_id);
 CREATE INDEX idx_mention_message ON mention(message_id);
 CREATE INDEX idx_mention_unread ON mention(mentioned_user_id, read) WHERE read = false;
+
+COMMIT;
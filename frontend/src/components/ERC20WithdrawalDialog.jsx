@@ -16,7 +16,7 @@
  * @date 2025-11-05
  */
 
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import {
   Dialog,
   DialogTitle,
@@ -49,6 +49,15 @@ import {
 } from '@mui/icons-material';
 import { useLanguage } from '../contexts/LanguageContext';
 
+// Gas prices move roughly once per block; reuse an estimate for this long
+const GAS_ESTIMATE_TTL_MS = 30000;
+
+// Transaction status polling: first check after 1s, backing off to 15s,
+// giving up after 5 minutes
+const STATUS_POLL_MIN_DELAY_MS = 1000;
+const STATUS_POLL_MAX_DELAY_MS = 15000;
+const STATUS_POLL_TIMEOUT_MS = 5 * 60 * 1000;
+
 /**
  * ERC-20 Withdrawal Dialog Component
  */
@@ -72,6 +81,7 @@ const ERC20WithdrawalDialog = ({ open, onClose, walletAddress, onSuccess }) => {
   const [loading, setLoading] = useState(false);
   const [estimating, setEstimating] = useState(false);
   const [gasEstimate, setGasEstimate] = useState(null);
+  const gasEstimateCache = useRef(new Map());
   const [txHash, setTxHash] = useState(null);
   const [txStatus, setTxStatus] = useState(null); // 'pending', 'confirmed', 'failed'
   const [error, setError] = useState(null);
@@ -123,6 +133,14 @@ const ERC20WithdrawalDialog = ({ open, onClose, walletAddress, onSuccess }) => {
    * Estimate gas cost for withdrawal
    */
   const estimateGas = async () => {
+    const cacheKey = [walletAddress, token, amount, recipientAddress, gasStrategy].join('|');
+    const cached = gasEstimateCache.current.get(cacheKey);
+    if (cached && Date.now() - cached.at < GAS_ESTIMATE_TTL_MS) {
+      setGasEstimate(cached.data);
+      setError(null);
+      return;
+    }
+    
     setEstimating(true);
     setGasEstimate(null);
     setError(null);
@@ -149,6 +167,7 @@ const ERC20WithdrawalDialog = ({ open, onClose, walletAddress, onSuccess }) => {
       }
       
       const data = await response.json();
+      gasEstimateCache.current.set(cacheKey, { data, at: Date.now() });
       setGasEstimate(data);
     } catch (err) {
       console.error('Gas estimation failed:', err);
@@ -217,13 +236,13 @@ const ERC20WithdrawalDialog = ({ open, onClose, walletAddress, onSuccess }) => {
   };
   
   /**
-   * Poll transaction status
+   * Poll transaction status, starting fast and backing off
    */
   const pollTransactionStatus = async (hash) => {
-    const maxAttempts = 60; // 5 minutes (5s intervals)
-    let attempts = 0;
+    const deadline = Date.now() + STATUS_POLL_TIMEOUT_MS;
+    let delay = STATUS_POLL_MIN_DELAY_MS;
     
-    const poll = setInterval(async () => {
+    const poll = async () => {
       try {
         const response = await fetch(`/api/wallets/custodial/transaction/${hash}`, {
           headers: {
@@ -238,7 +257,6 @@ const ERC20WithdrawalDialog = ({ open, onClose, walletAddress, onSuccess }) => {
         if (data.status === 'confirmed') {
           setTxStatus('confirmed');
           setLoading(false);
-          clearInterval(poll);
           
           // Reload balances
           loadBalances();
@@ -247,28 +265,28 @@ const ERC20WithdrawalDialog = ({ open, onClose, walletAddress, onSuccess }) => {
           if (onSuccess) {
             onSuccess(data);
           }
+          return;
         } else if (data.status === 'failed') {
           setTxStatus('failed');
           setError(t('payment.transactionFailed'));
           setLoading(false);
-          clearInterval(poll);
-        }
-        
-        attempts++;
-        if (attempts >= maxAttempts) {
-          clearInterval(poll);
-          setLoading(false);
-          setError(t('payment.statusCheckTimeout'));
+          return;
         }
       } catch (err) {
         console.error('Status check failed:', err);
-        attempts++;
-        if (attempts >= maxAttempts) {
-          clearInterval(poll);
-          setLoading(false);
-        }
       }
-    }, 5000); // Check every 5 seconds
+      
+      if (Date.now() >= deadline) {
+        setLoading(false);
+        setError(t('payment.statusCheckTimeout'));
+        return;
+      }
+      
+      setTimeout(poll, delay);
+      delay = Math.min(delay * 1.5, STATUS_POLL_MAX_DELAY_MS);
+    };
+    
+    setTimeout(poll, delay);
   };
   
   /**
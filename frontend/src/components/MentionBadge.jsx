@@ -18,6 +18,8 @@ const MentionBadge = ({ className = '' }) => {
     let mounted = true
 
     const fetchCount = async () => {
+      // Nobody sees the badge in a background tab; catch up when it is shown
+      if (document.hidden) return
       try {
         const c = await MentionService.getUnreadCount()
         if (mounted) setCount(c)
@@ -28,10 +30,12 @@ const MentionBadge = ({ className = '' }) => {
 
     fetchCount()
     const interval = setInterval(fetchCount, 30000) // poll every 30s
+    document.addEventListener('visibilitychange', fetchCount)
 
     return () => {
       mounted = false
       clearInterval(interval)
+      document.removeEventListener('visibilitychange', fetchCount)
     }
   }, [])
 
@@ -7,12 +7,25 @@ import { Search, ArrowUpRight, ArrowDownLeft, Copy, ExternalLink, ChevronLeft, L
 import { ethers } from 'ethers'
 
 const NETWORKS = [
-  { key: 'mainnet', label: 'Ethereum', rpc: 'https://eth.llamarpc.com', explorer: 'https://etherscan.io' },
-  { key: 'sepolia', label: 'Sepolia', rpc: 'https://rpc.sepolia.org', explorer: 'https://sepolia.etherscan.io' },
-  { key: 'polygon', label: 'Polygon', rpc: 'https://polygon-rpc.com', explorer: 'https://polygonscan.com' },
-  { key: 'base', label: 'Base', rpc: 'https://mainnet.base.org', explorer: 'https://basescan.org' },
+  { key: 'mainnet', label: 'Ethereum', chainId: 1, rpc: 'https://eth.llamarpc.com', explorer: 'https://etherscan.io' },
+  { key: 'sepolia', label: 'Sepolia', chainId: 11155111, rpc: 'https://rpc.sepolia.org', explorer: 'https://sepolia.etherscan.io' },
+  { key: 'polygon', label: 'Polygon', chainId: 137, rpc: 'https://polygon-rpc.com', explorer: 'https://polygonscan.com' },
+  { key: 'base', label: 'Base', chainId: 8453, rpc: 'https://mainnet.base.org', explorer: 'https://basescan.org' },
 ]
 
+// One provider per network, shared across searches so connections are reused.
+// The chain is fixed per entry, so skip ethers' network detection round-trip.
+const providers = new Map()
+
+function getProvider(network) {
+  let provider = providers.get(network.key)
+  if (!provider) {
+    provider = new ethers.JsonRpcProvider(network.rpc, network.chainId, { staticNetwork: true })
+    providers.set(network.key, provider)
+  }
+  return provider
+}
+
 function shortenAddr(addr) {
   if (!addr) return ''
   return `${addr.slice(0, 6)}...${addr.slice(-4)}`
@@ -37,7 +50,7 @@ export default function BlockchainExplorer() {
     setResult(null)
 
     try {
-      const provider = new ethers.JsonRpcProvider(network.rpc)
+      const provider = getProvider(network)
 
       // Detect query type
       if (/^0x[0-9a-fA-F]{64}$/.test(q)) {
@@ -99,15 +112,20 @@ export default function BlockchainExplorer() {
           const resolved = await provider.resolveName(q)
           if (resolved) {
             setQuery(resolved)
-            const balance = await provider.getBalance(resolved)
+            // Issued together so the provider sends them as one JSON-RPC batch.
+            const [balance, code, txCount] = await Promise.all([
+              provider.getBalance(resolved),
+              provider.getCode(resolved),
+              provider.getTransactionCount(resolved),
+            ])
             setResult({
               type: 'address',
               data: {
                 address: resolved,
                 ens: q,
                 balance: ethers.formatEther(balance),
-                isContract: false,
-                transactionCount: await provider.getTransactionCount(resolved),
+                isContract: code !== '0x',
+                transactionCount: txCount,
               },
             })
           } else {
@@ -59,7 +59,8 @@ const GroupSettingsPanel = () => {
   const loadAnnouncements = useCallback(async () => {
     try {
       const res = await GroupService.getAnnouncements(groupId)
-      setAnnouncements(res.data ?? [])
+      const data = res.data ?? []
+      setAnnouncements(Array.isArray(data) ? data : data.items || [])
     } catch (err) {
       console.error('Error loading announcements:', err)
     }
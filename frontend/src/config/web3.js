@@ -52,6 +52,13 @@ export const RPC_URLS = {
   mainnet: 'https://mainnet.infura.io/v3/9aa3d95b3bc440fa88ea12eaa4456161'
 }
 
+// Read-only endpoints in order of preference. When more than one is listed
+// the app races them, so a slow or down endpoint does not stall reads.
+export const READ_ONLY_RPC_URLS = {
+  sepolia: [RPC_URLS.sepolia, 'https://rpc.sepolia.org'],
+  mainnet: [RPC_URLS.mainnet, 'https://eth.llamarpc.com']
+}
+
 // TODO: Translate '区块浏览器' URL
 export const EXPLORER_URLS = {
   sepolia: 'https://sepolia.etherscan.io',
@@ -1,10 +1,39 @@
 import { createContext, useContext, useState, useEffect, useCallback } from 'react'
 import { ethers } from 'ethers'
-import { NETWORKS, DEFAULT_NETWORK, RPC_URLS } from '../config/web3'
+import { NETWORKS, DEFAULT_NETWORK, READ_ONLY_RPC_URLS } from '../config/web3'
 import web3AuthService from '../services/web3AuthService'
 
 const Web3Context = createContext()
 
+// How long an endpoint may take before the next one is queried in parallel
+const RPC_STALL_TIMEOUT_MS = 750
+
+/**
+ * Build the read-only provider for a network. With several endpoints each
+ * request goes to the preferred one first and is hedged to the next after
+ * RPC_STALL_TIMEOUT_MS; the first answer wins.
+ */
+const createReadOnlyProvider = (networkName) => {
+  const chainId = Number(NETWORKS[networkName].chainId)
+  const providers = READ_ONLY_RPC_URLS[networkName].map(
+    url => new ethers.JsonRpcProvider(url, chainId, { staticNetwork: true })
+  )
+
+  if (providers.length === 1) {
+    return providers[0]
+  }
+
+  return new ethers.FallbackProvider(
+    providers.map((provider, i) => ({
+      provider,
+      priority: i + 1,
+      stallTimeout: RPC_STALL_TIMEOUT_MS
+    })),
+    chainId,
+    { quorum: 1 }
+  )
+}
+
 export const useWeb3 = () => {
   const context = useContext(Web3Context)
   if (!context) {
@@ -62,17 +91,22 @@ export const Web3Provider = ({ children }) => {
       }
 
       // 创建 provider 和 signer
+      // 提前获取登录 nonce，与下面的链上查询并行
+      const nonceRequest = web3AuthService.requestNonce(accounts[0])
+      nonceRequest.catch(() => {}) // 错误在认证步骤中处理
+
+      // signer、网络和余额互不依赖，并发请求只需一次往返
       const web3Provider = new ethers.BrowserProvider(window.ethereum)
-      const web3Signer = await web3Provider.getSigner()
-      const network = await web3Provider.getNetwork()
+      const [web3Signer, network, userBalance] = await Promise.all([
+        web3Provider.getSigner(),
+        web3Provider.getNetwork(),
+        getBalance(accounts[0])
+      ])
 
       setAccount(accounts[0])
       setProvider(web3Provider)
       setSigner(web3Signer)
       setChainId(network.chainId.toString())
-
-      // 获取余额
-      const userBalance = await getBalance(accounts[0])
       setBalance(userBalance)
 
       // 尝试后端认证，失败时使用本地模式
@@ -82,7 +116,8 @@ export const Web3Provider = ({ children }) => {
           async (message) => {
             const signer = await web3Provider.getSigner()
             return await signer.signMessage(message)
-          }
+          },
+          nonceRequest
         )
         
         setIsAuthenticated(true)
@@ -230,7 +265,7 @@ export const Web3Provider = ({ children }) => {
   // TODO: Translate '创建只读' provider (TODO: Translate '用于未连接钱包时读取数据')
   useEffect(() => {
     if (!provider) {
-      const readOnlyProvider = new ethers.JsonRpcProvider(RPC_URLS[DEFAULT_NETWORK])
+      const readOnlyProvider = createReadOnlyProvider(DEFAULT_NETWORK)
       setProvider(readOnlyProvider)
     }
   }, [provider])
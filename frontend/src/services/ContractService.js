@@ -27,7 +27,8 @@ export class ContractService {
    */
   updateSigner(signer) {
     this.signer = signer
-    this.contract = new ethers.Contract(this.address, this.abi, signer)
+    // connect() reuses the already-parsed ABI interface
+    this.contract = this.contract.connect(signer)
   }
 
   /**
@@ -13,6 +13,10 @@ class FileUploadService {
       video: ['video/mp4', 'video/webm', 'video/ogg'],
       audio: ['audio/mpeg', 'audio/wav', 'audio/ogg']
     };
+    // Set per category for O(1) membership checks in validateFile
+    this.allowedTypeSets = Object.fromEntries(
+      Object.entries(this.allowedTypes).map(([category, types]) => [category, new Set(types)])
+    );
   }
 
   /**
@@ -27,8 +31,9 @@ class FileUploadService {
     }
 
     // Check file type
-    const allowedTypes = this.allowedTypes[category] || this.allowedTypes.image;
-    if (!allowedTypes.includes(file.type)) {
+    const knownCategory = Object.hasOwn(this.allowedTypeSets, category) ? category : 'image';
+    if (!this.allowedTypeSets[knownCategory].has(file.type)) {
+      const allowedTypes = this.allowedTypes[knownCategory];
       errors.push(`File type ${file.type} is not allowed. Allowed types: ${allowedTypes.join(', ')}`);
     }
 
@@ -83,33 +88,47 @@ class FileUploadService {
 
   /**
    * Upload multiple files
+   * Files are uploaded concurrently, at most `maxConcurrency` at a time.
+   * Results and errors keep the order of the input files.
    */
   async uploadMultiple(files, options = {}) {
-    const results = [];
-    const errors = [];
-
-    for (let i = 0; i < files.length; i++) {
-      try {
-        const result = await this.uploadFile(files[i], {
-          ...options,
-          onProgress: (progress) => {
-            if (options.onProgress) {
-              options.onProgress({
-                fileIndex: i,
-                totalFiles: files.length,
-                progress
-              });
+    const { maxConcurrency = 4, ...uploadOptions } = options;
+    const outcomes = new Array(files.length);
+    let next = 0;
+
+    const worker = async () => {
+      while (next < files.length) {
+        const i = next++;
+        try {
+          const result = await this.uploadFile(files[i], {
+            ...uploadOptions,
+            onProgress: (progress) => {
+              if (uploadOptions.onProgress) {
+                uploadOptions.onProgress({
+                  fileIndex: i,
+                  totalFiles: files.length,
+                  progress
+                });
+              }
             }
-          }
-        });
-        results.push(result);
-      } catch (error) {
-        errors.push({
-          file: files[i].name,
-          error: error.message
-        });
+          });
+          outcomes[i] = { result };
+        } catch (error) {
+          outcomes[i] = {
+            error: {
+              file: files[i].name,
+              error: error.message
+            }
+          };
+        }
       }
-    }
+    };
+
+    const workerCount = Math.min(Math.max(1, maxConcurrency), files.length);
+    await Promise.all(Array.from({ length: workerCount }, worker));
+
+    const results = outcomes.filter(o => o.result).map(o => o.result);
+    const errors = outcomes.filter(o => o.error).map(o => o.error);
 
     return {
       results,
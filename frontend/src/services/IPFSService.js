@@ -3,6 +3,17 @@
  * Uses Pinata as IPFS gateway for storing encrypted messages
  */
 
+import { withRetry } from '../utils/errorHandler';
+
+// Pinata requests are retried on network errors, timeouts, rate limiting
+// and 5xx responses, waiting 1s, 2s, ... between attempts. Each attempt is
+// aborted after PINATA_TIMEOUT_MS so a stalled connection cannot hang it.
+const PINATA_MAX_ATTEMPTS = 3;
+const PINATA_BACKOFF_MS = 1000;
+const PINATA_TIMEOUT_MS = 30000;
+
+const isRetryableStatus = (status) => status === 429 || status >= 500;
+
 class IPFSService {
     constructor() {
         // Pinata API configuration
@@ -13,11 +24,15 @@ class IPFSService {
         this.pinataGateway = import.meta.env.VITE_PINATA_GATEWAY || 'https://green-jittery-gecko-888.mypinata.cloud/ipfs/';
         this.pinataApiUrl = 'https://api.pinata.cloud';
 
-        console.log('🔧 Pinata Configuration:', {
-            hasJWT: !!this.pinataJWT,
-            hasApiKey: !!this.pinataApiKey,
-            gateway: this.pinataGateway
-        });
+        // The singleton is built when the module is imported, so keep this
+        // diagnostic out of production consoles.
+        if (import.meta.env.DEV) {
+            console.log('🔧 Pinata Configuration:', {
+                hasJWT: !!this.pinataJWT,
+                hasApiKey: !!this.pinataApiKey,
+                gateway: this.pinataGateway
+            });
+        }
     }
 
     /**
@@ -46,6 +61,50 @@ class IPFSService {
         return !!(this.pinataJWT || (this.pinataApiKey && this.pinataSecretKey));
     }
 
+    /**
+     * Send a request to the Pinata API, retrying transient failures
+     * Each attempt times out after PINATA_TIMEOUT_MS and is then retried.
+     * Non-retryable responses (e.g. 401, 403) are returned immediately.
+     * @param {string} path - API path, e.g. /pinning/pinFileToIPFS
+     * @param {Object} options - fetch options
+     * @param {number} attempts - Maximum number of attempts
+     * @returns {Promise<Response>}
+     */
+    async pinataRequest(path, options, attempts = PINATA_MAX_ATTEMPTS) {
+        let retryableResponse = null;
+        try {
+            return await withRetry(async () => {
+                retryableResponse = null;
+                let response;
+                try {
+                    response = await fetch(`${this.pinataApiUrl}${path}`, {
+                        ...options,
+                        signal: AbortSignal.timeout(PINATA_TIMEOUT_MS)
+                    });
+                } catch (error) {
+                    // A timed-out attempt is thrown like a network error so
+                    // withRetry tries again.
+                    if (error.name === 'TimeoutError') {
+                        throw new Error(`Pinata request timed out after ${PINATA_TIMEOUT_MS}ms`);
+                    }
+                    throw error;
+                }
+                if (isRetryableStatus(response.status)) {
+                    retryableResponse = response;
+                    throw new Error(`Pinata returned ${response.status}`);
+                }
+                return response;
+            }, attempts, PINATA_BACKOFF_MS);
+        } catch (error) {
+            // Out of attempts: hand the last error response to the caller,
+            // which reports it like any other non-ok response.
+            if (retryableResponse) {
+                return retryableResponse;
+            }
+            throw error;
+        }
+    }
+
     /**
      * Upload encrypted message to IPFS
      * @param {Object} encryptedData - Encrypted message package
@@ -66,7 +125,7 @@ class IPFSService {
                 },
             });
 
-            const response = await fetch(`${this.pinataApiUrl}/pinning/pinJSONToIPFS`, {
+            const response = await this.pinataRequest('/pinning/pinJSONToIPFS', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
@@ -172,7 +231,7 @@ class IPFSService {
             });
             formData.append('pinataMetadata', metadata);
 
-            const response = await fetch(`${this.pinataApiUrl}/pinning/pinFileToIPFS`, {
+            const response = await this.pinataRequest('/pinning/pinFileToIPFS', {
                 method: 'POST',
                 headers: {
                     ...this.getAuthHeaders(),
@@ -222,7 +281,7 @@ class IPFSService {
                 hashToPin: ipfsHash,
             });
 
-            const response = await fetch(`${this.pinataApiUrl}/pinning/pinByHash`, {
+            const response = await this.pinataRequest('/pinning/pinByHash', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
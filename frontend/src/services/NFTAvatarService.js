@@ -137,6 +137,8 @@ class NFTAvatarService {
     this.provider = null
     this.signer = null
     this.nftAvatarContract = null
+    // Read-only NFT contracts keyed by `${standard}:${address}`
+    this.nftContracts = new Map()
     this.backendUrl = process.env.REACT_APP_API_URL || 'http://localhost:5000'
   }
 
@@ -148,6 +150,7 @@ class NFTAvatarService {
     try {
       this.provider = new ethers.providers.Web3Provider(provider)
       this.signer = this.provider.getSigner()
+      this.nftContracts.clear()
       
       // Initialize NFT avatar contract
       this.nftAvatarContract = new ethers.Contract(
@@ -225,6 +228,23 @@ class NFTAvatarService {
     }
   }
 
+  /**
+   * Get a cached read-only contract for an NFT collection
+   * @param {string} nftContract - NFT contract address
+   * @param {string} standard - NFT standard ('ERC721' or 'ERC1155')
+   * @returns {Object} ethers Contract bound to the current provider
+   */
+  getNFTContract(nftContract, standard) {
+    const key = `${standard}:${nftContract.toLowerCase()}`
+    let contract = this.nftContracts.get(key)
+    if (!contract) {
+      const abi = standard === 'ERC721' ? ERC721_ABI : ERC1155_ABI
+      contract = new ethers.Contract(nftContract, abi, this.provider)
+      this.nftContracts.set(key, contract)
+    }
+    return contract
+  }
+
   /**
    * Check if user owns an NFT
    * @param {string} nftContract - NFT contract address
@@ -236,11 +256,11 @@ class NFTAvatarService {
   async checkNFTOwnership(nftContract, tokenId, standard, userAddress) {
     try {
       if (standard === 'ERC721') {
-        const contract = new ethers.Contract(nftContract, ERC721_ABI, this.provider)
+        const contract = this.getNFTContract(nftContract, standard)
         const owner = await contract.ownerOf(tokenId)
         return owner.toLowerCase() === userAddress.toLowerCase()
       } else if (standard === 'ERC1155') {
-        const contract = new ethers.Contract(nftContract, ERC1155_ABI, this.provider)
+        const contract = this.getNFTContract(nftContract, standard)
         const balance = await contract.balanceOf(userAddress, tokenId)
         return balance.gt(0)
       }
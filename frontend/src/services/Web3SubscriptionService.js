@@ -39,8 +39,30 @@ export const SUBSCRIPTION_PERIODS = {
   YEARLY: 1
 }
 
+// Subscription status (mirrors SubscriptionManager.SubscriptionStatus)
+export const SUBSCRIPTION_STATUS = {
+  ACTIVE: 0,
+  EXPIRED: 1,
+  CANCELLED: 2,
+  REFUNDED: 3
+}
+
+/**
+ * Recursively freeze an ABI literal so the module-level copy can be shared
+ * by every contract instance without risk of mutation.
+ * @param {*} value - ABI array, fragment or field
+ * @returns {*} The same value, frozen
+ */
+const deepFreeze = (value) => {
+  if (value && typeof value === 'object') {
+    Object.values(value).forEach(deepFreeze)
+    Object.freeze(value)
+  }
+  return value
+}
+
 // Minimal ABI for SubscriptionManager contract
-const SUBSCRIPTION_MANAGER_ABI = [
+const SUBSCRIPTION_MANAGER_ABI = deepFreeze([
   // Subscribe function
   {
     "inputs": [
@@ -129,10 +151,10 @@ const SUBSCRIPTION_MANAGER_ABI = [
     "stateMutability": "payable",
     "type": "function"
   }
-]
+])
 
 // ERC-20 token ABI (for approve function)
-const ERC20_ABI = [
+const ERC20_ABI = deepFreeze([
   {
     "inputs": [
       {"internalType": "address", "name": "spender", "type": "address"},
@@ -153,6 +175,15 @@ const ERC20_ABI = [
     "stateMutability": "view",
     "type": "function"
   }
+])
+
+// Read-only functions called on every status/pricing lookup. Their ABI
+// fragments are resolved once at initialization so each call only has to
+// encode arguments and issue a raw eth_call.
+const HOT_VIEW_FUNCTIONS = [
+  'getUserSubscription',
+  'getUserTier',
+  'pricing'
 ]
 
 class Web3SubscriptionService {
@@ -160,6 +191,15 @@ class Web3SubscriptionService {
     this.provider = null
     this.signer = null
     this.subscriptionContract = null
+    this.viewFragments = {}
+    // Lowercased address -> subscription endTime (ms). Only ACTIVE-status
+    // subscriptions are cached; they stay active until endTime, so the entry
+    // expires by itself.
+    this.activeUntil = new Map()
+    // Token address -> ERC-20 contract bound to the current signer
+    this.tokenContracts = new Map()
+    // Lowercased address -> pending getUserSubscription promise
+    this.inflightSubscriptions = new Map()
     this.backendUrl = process.env.REACT_APP_API_URL || 'http://localhost:5000'
   }
 
@@ -171,6 +211,7 @@ class Web3SubscriptionService {
     try {
       this.provider = new ethers.providers.Web3Provider(provider)
       this.signer = this.provider.getSigner()
+      this.tokenContracts.clear()
       
       // Initialize subscription contract
       this.subscriptionContract = new ethers.Contract(
@@ -178,6 +219,11 @@ class Web3SubscriptionService {
         SUBSCRIPTION_MANAGER_ABI,
         this.signer
       )
+
+      const contractInterface = this.subscriptionContract.interface
+      this.viewFragments = Object.fromEntries(
+        HOT_VIEW_FUNCTIONS.map(name => [name, contractInterface.getFunction(name)])
+      )
       
       console.log('✅ Web3SubscriptionService initialized')
       return true
@@ -187,6 +233,21 @@ class Web3SubscriptionService {
     }
   }
 
+  /**
+   * Call a view function through its precomputed ABI fragment
+   * @param {string} name - Function name (one of HOT_VIEW_FUNCTIONS)
+   * @param {Array} args - Function arguments
+   * @returns {*} Decoded result (unwrapped when there is a single output)
+   */
+  async _callView(name, args) {
+    const fragment = this.viewFragments[name]
+    const contractInterface = this.subscriptionContract.interface
+    const data = contractInterface.encodeFunctionData(fragment, args)
+    const raw = await this.provider.call({ to: SUBSCRIPTION_MANAGER_ADDRESS, data })
+    const result = contractInterface.decodeFunctionResult(fragment, raw)
+    return fragment.outputs.length === 1 ? result[0] : result
+  }
+
   /**
    * Get pricing for a subscription tier
    * @param {number} tier - Subscription tier (0=FREE, 1=PRO, 2=ENTERPRISE)
@@ -194,7 +255,7 @@ class Web3SubscriptionService {
    */
   async getPricing(tier) {
     try {
-      const pricing = await this.subscriptionContract.pricing(tier)
+      const pricing = await this._callView('pricing', [tier])
       
       return {
         monthlyPrice: pricing.monthlyPrice.toString(),
@@ -212,12 +273,34 @@ class Web3SubscriptionService {
 
   /**
    * Get user's subscription information
+   * Concurrent lookups for the same address share a single RPC call.
+   * @param {string} userAddress - User's wallet address
+   * @returns {Object} Subscription information
+   */
+  getUserSubscription(userAddress) {
+    const key = userAddress.toLowerCase()
+    let pending = this.inflightSubscriptions.get(key)
+
+    if (!pending) {
+      pending = this._fetchUserSubscription(userAddress).finally(() => {
+        this.inflightSubscriptions.delete(key)
+      })
+      this.inflightSubscriptions.set(key, pending)
+    }
+
+    return pending
+  }
+
+  /**
+   * Read a user's subscription from the contract
+   * startTime, endTime and createdAt are kept as epoch seconds; convert
+   * with new Date(seconds * 1000) only when rendering.
    * @param {string} userAddress - User's wallet address
    * @returns {Object} Subscription information
    */
-  async getUserSubscription(userAddress) {
+  async _fetchUserSubscription(userAddress) {
     try {
-      const subscription = await this.subscriptionContract.getUserSubscription(userAddress)
+      const subscription = await this._callView('getUserSubscription', [userAddress])
       
       // Check if subscription exists (id > 0)
       if (subscription.id.toNumber() === 0) {
@@ -230,12 +313,12 @@ class Web3SubscriptionService {
         tier: subscription.tier,
         duration: subscription.duration,
         status: subscription.status,
-        startTime: new Date(subscription.startTime.toNumber() * 1000),
-        endTime: new Date(subscription.endTime.toNumber() * 1000),
+        startTime: subscription.startTime.toNumber(),
+        endTime: subscription.endTime.toNumber(),
         amount: subscription.amount.toString(),
         paymentToken: subscription.paymentToken,
         autoRenew: subscription.autoRenew,
-        createdAt: new Date(subscription.createdAt.toNumber() * 1000)
+        createdAt: subscription.createdAt.toNumber()
       }
     } catch (error) {
       console.error('Error getting user subscription:', error)
@@ -250,7 +333,7 @@ class Web3SubscriptionService {
    */
   async getUserTier(userAddress) {
     try {
-      const tier = await this.subscriptionContract.getUserTier(userAddress)
+      const tier = await this._callView('getUserTier', [userAddress])
       return tier
     } catch (error) {
       console.error('Error getting user tier:', error)
@@ -258,20 +341,58 @@ class Web3SubscriptionService {
     }
   }
 
+  /**
+   * Get user's subscription together with its active flag
+   * A subscription is active only while its status is ACTIVE and its
+   * endTime has not passed; active ones are remembered until endTime.
+   * @param {string} userAddress - User's wallet address
+   * @returns {Object} { subscription, active }
+   */
+  async getUserStatus(userAddress) {
+    const subscription = await this.getUserSubscription(userAddress)
+    const endTime = subscription ? subscription.endTime * 1000 : 0
+    const active = Boolean(subscription) &&
+      Number(subscription.status) === SUBSCRIPTION_STATUS.ACTIVE &&
+      endTime > Date.now()
+    const key = userAddress.toLowerCase()
+
+    if (active) {
+      this.activeUntil.set(key, endTime)
+    } else {
+      this.activeUntil.delete(key)
+    }
+
+    return { subscription, active }
+  }
+
   /**
    * Check if user has an active subscription
    * @param {string} userAddress - User's wallet address
    * @returns {boolean} True if subscription is active
    */
   async isSubscriptionActive(userAddress) {
+    const activeUntil = this.activeUntil.get(userAddress.toLowerCase())
+    if (activeUntil && Date.now() < activeUntil) {
+      return true
+    }
+
     try {
-      return await this.subscriptionContract.isSubscriptionActive(userAddress)
+      const { active } = await this.getUserStatus(userAddress)
+      return active
     } catch (error) {
       console.error('Error checking subscription status:', error)
       return false
     }
   }
 
+  /**
+   * Forget the cached status of the connected wallet after a state change
+   */
+  async invalidateStatus() {
+    const userAddress = await this.signer.getAddress()
+    this.activeUntil.delete(userAddress.toLowerCase())
+  }
+
   /**
    * Subscribe to a tier with crypto payment
    * @param {number} tier - Subscription tier
@@ -316,6 +437,7 @@ class Web3SubscriptionService {
       // Step 5: Wait for confirmation
       onProgress?.({ step: 5, message: 'Waiting for confirmation...' })
       const receipt = await tx.wait()
+      await this.invalidateStatus()
       
       // Step 6: Sync with backend
       onProgress?.({ step: 6, message: 'Syncing with backend...' })
@@ -334,6 +456,20 @@ class Web3SubscriptionService {
     }
   }
 
+  /**
+   * Get the ERC-20 contract for a token, parsing its ABI only once
+   * @param {string} tokenAddress - Token contract address
+   * @returns {Object} ethers Contract bound to the signer
+   */
+  getTokenContract(tokenAddress) {
+    let tokenContract = this.tokenContracts.get(tokenAddress)
+    if (!tokenContract) {
+      tokenContract = new ethers.Contract(tokenAddress, ERC20_ABI, this.signer)
+      this.tokenContracts.set(tokenAddress, tokenContract)
+    }
+    return tokenContract
+  }
+
   /**
    * Approve ERC-20 token spending
    * @param {string} tokenAddress - Token contract address
@@ -341,11 +477,7 @@ class Web3SubscriptionService {
    */
   async approveTokenSpending(tokenAddress, amount) {
     try {
-      const tokenContract = new ethers.Contract(
-        tokenAddress,
-        ERC20_ABI,
-        this.signer
-      )
+      const tokenContract = this.getTokenContract(tokenAddress)
       
       // Check current allowance
       const userAddress = await this.signer.getAddress()
@@ -379,6 +511,7 @@ class Web3SubscriptionService {
     try {
       const tx = await this.subscriptionContract.cancelSubscription()
       const receipt = await tx.wait()
+      await this.invalidateStatus()
       
       return {
         success: true,
@@ -426,6 +559,7 @@ class Web3SubscriptionService {
       // Wait for confirmation
       onProgress?.({ step: 3, message: 'Waiting for confirmation...' })
       const receipt = await tx.wait()
+      await this.invalidateStatus()
       
       // Sync with backend
       onProgress?.({ step: 4, message: 'Syncing with backend...' })
@@ -126,4 +126,29 @@ describe('FileUploadService', () => {
         .rejects.toThrow('exceeds')
     })
   })
+
+  describe('uploadMultiple', () => {
+    it('should upload concurrently up to the limit and keep input order', async () => {
+      let inFlight = 0
+      let maxInFlight = 0
+      vi.spyOn(service, 'uploadFile').mockImplementation(async (file) => {
+        inFlight++
+        maxInFlight = Math.max(maxInFlight, inFlight)
+        await new Promise(resolve => setTimeout(resolve, file.name === 'a.png' ? 20 : 5))
+        inFlight--
+        if (file.name === 'c.png') throw new Error('boom')
+        return { success: true, filename: file.name }
+      })
+
+      const files = ['a.png', 'b.png', 'c.png', 'd.png'].map(
+        name => new File(['x'], name, { type: 'image/png' })
+      )
+      const result = await service.uploadMultiple(files, { maxConcurrency: 2 })
+
+      expect(maxInFlight).toBe(2)
+      expect(result.results.map(r => r.filename)).toEqual(['a.png', 'b.png', 'd.png'])
+      expect(result.errors).toEqual([{ file: 'c.png', error: 'boom' }])
+      expect(result.success).toBe(false)
+    })
+  })
 })
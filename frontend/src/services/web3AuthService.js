@@ -105,12 +105,13 @@ class Web3AuthService {
    * Complete wallet authentication flow
    * @param {string} walletAddress - The user's wallet address
    * @param {Function} signMessageFn - Function to sign the message (from wallet provider)
+   * @param {Promise} [nonceRequest] - Nonce request already started by the caller
    * @returns {Promise<{token: string, user: object}>}
    */
-  async authenticateWallet(walletAddress, signMessageFn) {
+  async authenticateWallet(walletAddress, signMessageFn, nonceRequest = null) {
     try {
-      // Step 1: Request nonce from backend
-      const { message, isLocal } = await this.requestNonce(walletAddress)
+      // Step 1: Request nonce from backend (unless the caller prefetched it)
+      const { message, isLocal } = await (nonceRequest || this.requestNonce(walletAddress))
       
       // Step 2: Sign the message with wallet
       const signature = await signMessageFn(message)
@@ -30,6 +30,15 @@ log_info() {
   echo -e "${YELLOW}🔍 TEST${NC}: $1"
 }
 
+# Helper: print True/False for the envelope's success flag. The API always
+# serializes "success" first, so this avoids starting python3 per check.
+json_success() {
+  case "$1" in
+    '{"success":true'*) echo "True" ;;
+    *) echo "False" ;;
+  esac
+}
+
 # Helper: make authenticated request
 auth_request() {
   local method=$1
@@ -116,7 +125,7 @@ if [ -z "$USER1_ID" ] || [ -z "$USER2_ID" ]; then
 fi
 log_pass "Test users created — User1 ID: $USER1_ID, User2 ID: $USER2_ID"
 
-# Generate JWT tokens using Go
+# Generate JWT tokens using Go (one build, one token per user ID argument)
 cat > /tmp/gen_jwt.go << 'GOEOF'
 package main
 
@@ -129,30 +138,37 @@ import (
 	"github.com/golang-jwt/jwt/v5"
 )
 
+// usage: gen_jwt <secret> <role> <user_id>...
 func main() {
-	userID, _ := strconv.Atoi(os.Args[1])
-	secret := os.Args[2]
-
-	token := jwt.NewWithClaims(jwt.SigningMethodHS256, jwt.MapClaims{
-		"user_id": userID,
-		"iss":     "dchat",
-		"exp":     time.Now().Add(24 * time.Hour).Unix(),
-		"iat":     time.Now().Unix(),
-	})
-
-	tokenString, err := token.SignedString([]byte(secret))
-	if err != nil {
-		fmt.Fprintf(os.Stderr, "Error: %v\n", err)
-		os.Exit(1)
+	secret := []byte(os.Args[1])
+	role := os.Args[2]
+	now := time.Now()
+
+	for _, arg := range os.Args[3:] {
+		userID, _ := strconv.Atoi(arg)
+		token := jwt.NewWithClaims(jwt.SigningMethodHS256, jwt.MapClaims{
+			"user_id": userID,
+			"role":    role,
+			"iss":     "dchat",
+			"exp":     now.Add(24 * time.Hour).Unix(),
+			"iat":     now.Unix(),
+		})
+
+		tokenString, err := token.SignedString(secret)
+		if err != nil {
+			fmt.Fprintf(os.Stderr, "Error: %v\n", err)
+			os.Exit(1)
+		}
+		fmt.Println(tokenString)
 	}
-	fmt.Print(tokenString)
 }
 GOEOF
 
 export PATH=$PATH:/usr/local/go/bin
 cd /home/ubuntu/dchat/backend-go
-TOKEN1=$(go run /tmp/gen_jwt2.go "$USER1_ID" "dchat_local_test_jwt_secret_key_at_least_32_chars" "user" 2>/dev/null)
-TOKEN2=$(go run /tmp/gen_jwt2.go "$USER2_ID" "dchat_local_test_jwt_secret_key_at_least_32_chars" "user" 2>/dev/null)
+TOKENS=$(go run /tmp/gen_jwt.go "dchat_local_test_jwt_secret_key_at_least_32_chars" "user" "$USER1_ID" "$USER2_ID" 2>/dev/null)
+TOKEN1=$(echo "$TOKENS" | sed -n 1p)
+TOKEN2=$(echo "$TOKENS" | sed -n 2p)
 
 if [ -z "$TOKEN1" ] || [ -z "$TOKEN2" ]; then
   log_fail "Generate JWT tokens" "Failed to generate tokens"
@@ -163,7 +179,7 @@ log_pass "JWT tokens generated for both users"
 # Test GET /api/auth/me
 log_info "Test GET /api/auth/me for User 1"
 ME_RES=$(auth_request GET "/api/auth/me" "" "$TOKEN1")
-ME_SUCCESS=$(echo "$ME_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+ME_SUCCESS=$(json_success "$ME_RES")
 if [ "$ME_SUCCESS" = "True" ]; then
   log_pass "GET /api/auth/me — User 1 profile retrieved"
 else
@@ -178,7 +194,7 @@ log_info "Send message from User 1 to User 2"
 MSG_RES=$(auth_request POST "/api/messages/send" \
   "{\"receiver_id\": $USER2_ID, \"content\": \"Hello from User 1!\", \"message_type\": \"text\"}" \
   "$TOKEN1")
-MSG_SUCCESS=$(echo "$MSG_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+MSG_SUCCESS=$(json_success "$MSG_RES")
 if [ "$MSG_SUCCESS" = "True" ]; then
   MSG_ID=$(echo "$MSG_RES" | python3 -c "import sys,json; print(json.load(sys.stdin)['data']['id'])" 2>/dev/null)
   log_pass "Send message — Message ID: $MSG_ID"
@@ -190,7 +206,7 @@ log_info "Send reply from User 2 to User 1"
 MSG_RES2=$(auth_request POST "/api/messages/send" \
   "{\"receiver_id\": $USER1_ID, \"content\": \"Hi back from User 2!\", \"message_type\": \"text\"}" \
   "$TOKEN2")
-MSG_SUCCESS2=$(echo "$MSG_RES2" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+MSG_SUCCESS2=$(json_success "$MSG_RES2")
 if [ "$MSG_SUCCESS2" = "True" ]; then
   log_pass "Send reply — Message sent"
 else
@@ -199,7 +215,7 @@ fi
 
 log_info "Get message history between User 1 and User 2"
 HIST_RES=$(auth_request GET "/api/messages/$USER2_ID" "" "$TOKEN1")
-HIST_SUCCESS=$(echo "$HIST_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+HIST_SUCCESS=$(json_success "$HIST_RES")
 if [ "$HIST_SUCCESS" = "True" ]; then
   HIST_COUNT=$(echo "$HIST_RES" | python3 -c "import sys,json; d=json.load(sys.stdin)['data']; print(len(d.get('items',d)) if isinstance(d,dict) else len(d))" 2>/dev/null)
   log_pass "Get message history — $HIST_COUNT messages found"
@@ -209,7 +225,7 @@ fi
 
 log_info "Get conversations list"
 CONV_RES=$(auth_request GET "/api/messages/conversations" "" "$TOKEN1")
-CONV_SUCCESS=$(echo "$CONV_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+CONV_SUCCESS=$(json_success "$CONV_RES")
 if [ "$CONV_SUCCESS" = "True" ]; then
   log_pass "Get conversations — List retrieved"
 else
@@ -218,7 +234,7 @@ fi
 
 log_info "Mark messages as read"
 READ_RES=$(auth_request PUT "/api/messages/$USER1_ID/read" "" "$TOKEN2")
-READ_SUCCESS=$(echo "$READ_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+READ_SUCCESS=$(json_success "$READ_RES")
 if [ "$READ_SUCCESS" = "True" ]; then
   log_pass "Mark as read — Messages marked"
 else
@@ -227,7 +243,7 @@ fi
 
 log_info "Recall message"
 RECALL_RES=$(auth_request PUT "/api/messages/$MSG_ID/recall" "" "$TOKEN1")
-RECALL_SUCCESS=$(echo "$RECALL_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+RECALL_SUCCESS=$(json_success "$RECALL_RES")
 if [ "$RECALL_SUCCESS" = "True" ]; then
   log_pass "Recall message — Message recalled"
 else
@@ -248,7 +264,7 @@ fi
 log_info "Forward message"
 FWD_RES=$(auth_request POST "/api/messages/forward" \
   "{\"message_ids\": [$MSG_ID], \"receiver_ids\": [$USER2_ID]}" "$TOKEN1")
-FWD_STATUS=$(echo "$FWD_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+FWD_STATUS=$(json_success "$FWD_RES")
 if [ "$FWD_STATUS" = "True" ]; then
   log_pass "Forward message — Message forwarded"
 else
@@ -263,7 +279,7 @@ log_info "Send friend request from User 1 to User 2"
 FR_RES=$(auth_request POST "/api/friends/request" \
   "{\"receiver_id\": $USER2_ID, \"message\": \"Let's connect!\", \"source\": \"search\"}" \
   "$TOKEN1")
-FR_SUCCESS=$(echo "$FR_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+FR_SUCCESS=$(json_success "$FR_RES")
 FR_ID=$(echo "$FR_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('data',{}).get('id',''))" 2>/dev/null)
 if [ "$FR_SUCCESS" = "True" ]; then
   log_pass "Send friend request — Request ID: $FR_ID"
@@ -273,7 +289,7 @@ fi
 
 log_info "List received friend requests for User 2"
 FR_LIST=$(auth_request GET "/api/friends/requests?direction=received" "" "$TOKEN2")
-FR_LIST_SUCCESS=$(echo "$FR_LIST" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+FR_LIST_SUCCESS=$(json_success "$FR_LIST")
 if [ "$FR_LIST_SUCCESS" = "True" ]; then
   FR_COUNT=$(echo "$FR_LIST" | python3 -c "import sys,json; print(len(json.load(sys.stdin).get('data',[])))" 2>/dev/null)
   log_pass "List friend requests — $FR_COUNT pending requests"
@@ -283,7 +299,7 @@ fi
 
 log_info "Accept friend request"
 ACCEPT_RES=$(auth_request POST "/api/friends/requests/$FR_ID/accept" "" "$TOKEN2")
-ACCEPT_SUCCESS=$(echo "$ACCEPT_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+ACCEPT_SUCCESS=$(json_success "$ACCEPT_RES")
 if [ "$ACCEPT_SUCCESS" = "True" ]; then
   log_pass "Accept friend request — Friendship established"
 else
@@ -292,7 +308,7 @@ fi
 
 log_info "List friends for User 1"
 FRIENDS_RES=$(auth_request GET "/api/friends" "" "$TOKEN1")
-FRIENDS_SUCCESS=$(echo "$FRIENDS_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+FRIENDS_SUCCESS=$(json_success "$FRIENDS_RES")
 if [ "$FRIENDS_SUCCESS" = "True" ]; then
   FRIENDS_COUNT=$(echo "$FRIENDS_RES" | python3 -c "import sys,json; print(len(json.load(sys.stdin).get('data',[])))" 2>/dev/null)
   log_pass "List friends — $FRIENDS_COUNT friends found"
@@ -302,7 +318,7 @@ fi
 
 log_info "Search users"
 SEARCH_RES=$(auth_request GET "/api/friends/search?q=testuser" "" "$TOKEN1")
-SEARCH_SUCCESS=$(echo "$SEARCH_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+SEARCH_SUCCESS=$(json_success "$SEARCH_RES")
 if [ "$SEARCH_SUCCESS" = "True" ]; then
   log_pass "Search users — Search works"
 else
@@ -324,7 +340,7 @@ log_info "Send friend request by wallet address (NFC)"
 NFC_RES=$(auth_request POST "/api/friends/request-by-wallet" \
   "{\"wallet_address\": \"$WALLET3\", \"message\": \"NFC connect!\", \"source\": \"nfc\"}" \
   "$TOKEN1")
-NFC_SUCCESS=$(echo "$NFC_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+NFC_SUCCESS=$(json_success "$NFC_RES")
 if [ "$NFC_SUCCESS" = "True" ]; then
   log_pass "NFC friend request — Request sent via wallet address"
 else
@@ -339,7 +355,7 @@ log_info "Invite friend via email"
 INVITE_RES=$(auth_request POST "/api/account/invite-friend" \
   "{\"inviter_address\": \"$WALLET1\", \"invitee_identifier\": \"friend@example.com\", \"type\": \"email\"}" \
   "$TOKEN1")
-INVITE_SUCCESS=$(echo "$INVITE_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+INVITE_SUCCESS=$(json_success "$INVITE_RES")
 if [ "$INVITE_SUCCESS" = "True" ]; then
   log_pass "Invite friend — Invitation sent"
 else
@@ -354,7 +370,7 @@ log_info "Update user profile"
 PROFILE_RES=$(auth_request PUT "/api/user/me" \
   "{\"name\": \"Updated Name\", \"bio\": \"I am a blockchain developer\", \"company\": \"DChat Inc\", \"position\": \"CTO\"}" \
   "$TOKEN1")
-PROFILE_SUCCESS=$(echo "$PROFILE_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+PROFILE_SUCCESS=$(json_success "$PROFILE_RES")
 if [ "$PROFILE_SUCCESS" = "True" ]; then
   UPDATED_NAME=$(echo "$PROFILE_RES" | python3 -c "import sys,json; print(json.load(sys.stdin)['data']['name'])" 2>/dev/null)
   log_pass "Update profile — Name: $UPDATED_NAME"
@@ -370,7 +386,7 @@ log_info "Create skill"
 SKILL_RES=$(auth_request POST "/api/profile/skills" \
   "{\"name\": \"Solidity\", \"category\": \"Blockchain\", \"level\": 5}" \
   "$TOKEN1")
-SKILL_SUCCESS=$(echo "$SKILL_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+SKILL_SUCCESS=$(json_success "$SKILL_RES")
 SKILL_ID=$(echo "$SKILL_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('data',{}).get('id',''))" 2>/dev/null)
 if [ "$SKILL_SUCCESS" = "True" ]; then
   log_pass "Create skill — Skill ID: $SKILL_ID"
@@ -380,7 +396,7 @@ fi
 
 log_info "List skills"
 SKILLS_LIST=$(auth_request GET "/api/profile/skills" "" "$TOKEN1")
-SKILLS_LIST_SUCCESS=$(echo "$SKILLS_LIST" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+SKILLS_LIST_SUCCESS=$(json_success "$SKILLS_LIST")
 if [ "$SKILLS_LIST_SUCCESS" = "True" ]; then
   SKILLS_COUNT=$(echo "$SKILLS_LIST" | python3 -c "import sys,json; print(len(json.load(sys.stdin).get('data',[])))" 2>/dev/null)
   log_pass "List skills — $SKILLS_COUNT skills found"
@@ -392,7 +408,7 @@ log_info "Update skill"
 SKILL_UPD=$(auth_request PUT "/api/profile/skills/$SKILL_ID" \
   "{\"name\": \"Solidity\", \"category\": \"Smart Contracts\", \"level\": 5}" \
   "$TOKEN1")
-SKILL_UPD_SUCCESS=$(echo "$SKILL_UPD" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+SKILL_UPD_SUCCESS=$(json_success "$SKILL_UPD")
 if [ "$SKILL_UPD_SUCCESS" = "True" ]; then
   log_pass "Update skill — Category updated"
 else
@@ -416,7 +432,7 @@ log_info "Create project"
 PROJ_RES=$(auth_request POST "/api/profile/projects" \
   "{\"title\": \"DChat App\", \"description\": \"Decentralized chat application\", \"status\": \"active\"}" \
   "$TOKEN1")
-PROJ_SUCCESS=$(echo "$PROJ_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+PROJ_SUCCESS=$(json_success "$PROJ_RES")
 PROJ_ID=$(echo "$PROJ_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('data',{}).get('id',''))" 2>/dev/null)
 if [ "$PROJ_SUCCESS" = "True" ]; then
   log_pass "Create project — Project ID: $PROJ_ID"
@@ -426,7 +442,7 @@ fi
 
 log_info "List projects"
 PROJ_LIST=$(auth_request GET "/api/profile/projects" "" "$TOKEN1")
-PROJ_LIST_SUCCESS=$(echo "$PROJ_LIST" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+PROJ_LIST_SUCCESS=$(json_success "$PROJ_LIST")
 if [ "$PROJ_LIST_SUCCESS" = "True" ]; then
   log_pass "List projects — Projects retrieved"
 else
@@ -441,7 +457,7 @@ log_info "Create resource"
 RES_RES=$(auth_request POST "/api/profile/resources" \
   "{\"title\": \"Blockchain Consulting\", \"description\": \"Expert consulting services\", \"category\": \"consulting\"}" \
   "$TOKEN1")
-RES_SUCCESS=$(echo "$RES_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+RES_SUCCESS=$(json_success "$RES_RES")
 if [ "$RES_SUCCESS" = "True" ]; then
   log_pass "Create resource — Resource created"
 else
@@ -450,7 +466,7 @@ fi
 
 log_info "List resources"
 RES_LIST=$(auth_request GET "/api/profile/resources" "" "$TOKEN1")
-RES_LIST_SUCCESS=$(echo "$RES_LIST" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+RES_LIST_SUCCESS=$(json_success "$RES_LIST")
 if [ "$RES_LIST_SUCCESS" = "True" ]; then
   log_pass "List resources — Resources retrieved"
 else
@@ -465,7 +481,7 @@ log_info "Create seeking item"
 SEEK_RES=$(auth_request POST "/api/profile/seeking" \
   "{\"title\": \"Smart Contract Auditor\", \"description\": \"Looking for security audit partner\", \"category\": \"security\", \"priority\": \"high\"}" \
   "$TOKEN1")
-SEEK_SUCCESS=$(echo "$SEEK_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+SEEK_SUCCESS=$(json_success "$SEEK_RES")
 if [ "$SEEK_SUCCESS" = "True" ]; then
   log_pass "Create seeking — Seeking item created"
 else
@@ -474,7 +490,7 @@ fi
 
 log_info "List seeking items"
 SEEK_LIST=$(auth_request GET "/api/profile/seeking" "" "$TOKEN1")
-SEEK_LIST_SUCCESS=$(echo "$SEEK_LIST" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+SEEK_LIST_SUCCESS=$(json_success "$SEEK_LIST")
 if [ "$SEEK_LIST_SUCCESS" = "True" ]; then
   log_pass "List seeking — Seeking items retrieved"
 else
@@ -489,7 +505,7 @@ log_info "Create/update business info"
 BIZ_RES=$(auth_request PUT "/api/profile/business" \
   "{\"company_name\": \"DChat Inc\", \"job_title\": \"CTO\", \"industry\": \"Blockchain\", \"location\": \"Singapore\", \"website\": \"https://dchat.io\", \"bio\": \"Building the future of communication\"}" \
   "$TOKEN1")
-BIZ_SUCCESS=$(echo "$BIZ_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+BIZ_SUCCESS=$(json_success "$BIZ_RES")
 if [ "$BIZ_SUCCESS" = "True" ]; then
   log_pass "Upsert business info — Business info saved"
 else
@@ -498,7 +514,7 @@ fi
 
 log_info "Get business info"
 BIZ_GET=$(auth_request GET "/api/profile/business" "" "$TOKEN1")
-BIZ_GET_SUCCESS=$(echo "$BIZ_GET" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+BIZ_GET_SUCCESS=$(json_success "$BIZ_GET")
 if [ "$BIZ_GET_SUCCESS" = "True" ]; then
   BIZ_COMPANY=$(echo "$BIZ_GET" | python3 -c "import sys,json; print(json.load(sys.stdin)['data'].get('company_name',''))" 2>/dev/null)
   log_pass "Get business info — Company: $BIZ_COMPANY"
@@ -512,7 +528,7 @@ echo "━━━ 12. BUSINESS MATCHING ━━━"
 
 log_info "Get matching recommendations"
 MATCH_RES=$(auth_request GET "/api/matching/recommendations" "" "$TOKEN1")
-MATCH_SUCCESS=$(echo "$MATCH_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+MATCH_SUCCESS=$(json_success "$MATCH_RES")
 if [ "$MATCH_SUCCESS" = "True" ]; then
   log_pass "Get recommendations — Matching endpoint works"
 else
@@ -523,7 +539,7 @@ log_info "Record matching feedback"
 FEEDBACK_RES=$(auth_request POST "/api/matching/feedback" \
   "{\"target_user_id\": $USER2_ID, \"action\": \"interested\"}" \
   "$TOKEN1")
-FEEDBACK_SUCCESS=$(echo "$FEEDBACK_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+FEEDBACK_SUCCESS=$(json_success "$FEEDBACK_RES")
 if [ "$FEEDBACK_SUCCESS" = "True" ]; then
   log_pass "Record feedback — Feedback recorded"
 else
@@ -538,7 +554,7 @@ log_info "Create group"
 GRP_RES=$(auth_request POST "/api/groups" \
   "{\"name\": \"Test Group\", \"description\": \"A test group for integration testing\"}" \
   "$TOKEN1")
-GRP_SUCCESS=$(echo "$GRP_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+GRP_SUCCESS=$(json_success "$GRP_RES")
 GRP_ID=$(echo "$GRP_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('data',{}).get('id',''))" 2>/dev/null)
 if [ "$GRP_SUCCESS" = "True" ]; then
   log_pass "Create group — Group ID: $GRP_ID"
@@ -548,7 +564,7 @@ fi
 
 log_info "Get group details"
 GRP_GET=$(auth_request GET "/api/groups/$GRP_ID" "" "$TOKEN1")
-GRP_GET_SUCCESS=$(echo "$GRP_GET" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+GRP_GET_SUCCESS=$(json_success "$GRP_GET")
 if [ "$GRP_GET_SUCCESS" = "True" ]; then
   log_pass "Get group — Group details retrieved"
 else
@@ -559,7 +575,7 @@ log_info "Add member to group"
 ADD_MEM=$(auth_request POST "/api/groups/$GRP_ID/members" \
   "{\"user_id\": $USER2_ID}" \
   "$TOKEN1")
-ADD_MEM_SUCCESS=$(echo "$ADD_MEM" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+ADD_MEM_SUCCESS=$(json_success "$ADD_MEM")
 if [ "$ADD_MEM_SUCCESS" = "True" ]; then
   log_pass "Add member — User 2 added to group"
 else
@@ -570,7 +586,7 @@ log_info "Send group message"
 GMSG_RES=$(auth_request POST "/api/groups/$GRP_ID/messages" \
   "{\"content\": \"Hello group!\", \"message_type\": \"text\"}" \
   "$TOKEN1")
-GMSG_SUCCESS=$(echo "$GMSG_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+GMSG_SUCCESS=$(json_success "$GMSG_RES")
 if [ "$GMSG_SUCCESS" = "True" ]; then
   log_pass "Send group message — Message sent"
 else
@@ -579,7 +595,7 @@ fi
 
 log_info "Get group messages"
 GMSG_LIST=$(auth_request GET "/api/groups/$GRP_ID/messages" "" "$TOKEN1")
-GMSG_LIST_SUCCESS=$(echo "$GMSG_LIST" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+GMSG_LIST_SUCCESS=$(json_success "$GMSG_LIST")
 if [ "$GMSG_LIST_SUCCESS" = "True" ]; then
   log_pass "Get group messages — Messages retrieved"
 else
@@ -588,7 +604,7 @@ fi
 
 log_info "List my groups"
 MY_GRPS=$(auth_request GET "/api/groups" "" "$TOKEN1")
-MY_GRPS_SUCCESS=$(echo "$MY_GRPS" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+MY_GRPS_SUCCESS=$(json_success "$MY_GRPS")
 if [ "$MY_GRPS_SUCCESS" = "True" ]; then
   log_pass "List my groups — Groups retrieved"
 else
@@ -599,7 +615,7 @@ log_info "Create group announcement"
 ANN_RES=$(auth_request POST "/api/groups/$GRP_ID/announcements" \
   "{\"content\": \"Welcome to the test group!\"}" \
   "$TOKEN1")
-ANN_SUCCESS=$(echo "$ANN_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+ANN_SUCCESS=$(json_success "$ANN_RES")
 if [ "$ANN_SUCCESS" = "True" ]; then
   log_pass "Create announcement — Announcement created"
 else
@@ -610,7 +626,7 @@ log_info "Mute member"
 MUTE_RES=$(auth_request PUT "/api/groups/$GRP_ID/members/$USER2_ID/mute" \
   "{\"muted\": true, \"duration\": 3600}" \
   "$TOKEN1")
-MUTE_SUCCESS=$(echo "$MUTE_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+MUTE_SUCCESS=$(json_success "$MUTE_RES")
 if [ "$MUTE_SUCCESS" = "True" ]; then
   log_pass "Mute member — Member muted"
 else
@@ -635,7 +651,7 @@ echo "━━━ 15. MENTIONS ━━━"
 
 log_info "Get unread mentions"
 MENT_RES=$(auth_request GET "/api/mentions/unread" "" "$TOKEN1")
-MENT_SUCCESS=$(echo "$MENT_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+MENT_SUCCESS=$(json_success "$MENT_RES")
 if [ "$MENT_SUCCESS" = "True" ]; then
   log_pass "Get unread mentions — Endpoint works"
 else
@@ -644,7 +660,7 @@ fi
 
 log_info "Get unread mention count"
 MENT_CNT=$(auth_request GET "/api/mentions/unread/count" "" "$TOKEN1")
-MENT_CNT_SUCCESS=$(echo "$MENT_CNT" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+MENT_CNT_SUCCESS=$(json_success "$MENT_CNT")
 if [ "$MENT_CNT_SUCCESS" = "True" ]; then
   log_pass "Get mention count — Endpoint works"
 else
@@ -657,7 +673,7 @@ echo "━━━ 16. TWO-FACTOR AUTH ━━━"
 
 log_info "Setup 2FA"
 TFA_RES=$(auth_request POST "/api/auth/2fa/setup" "" "$TOKEN1")
-TFA_SUCCESS=$(echo "$TFA_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+TFA_SUCCESS=$(json_success "$TFA_RES")
 if [ "$TFA_SUCCESS" = "True" ]; then
   log_pass "Setup 2FA — QR code/secret generated"
 else
@@ -670,11 +686,11 @@ echo "━━━ 17. ADMIN DASHBOARD ━━━"
 
 # Make User 1 an admin and regenerate token with admin role
 sudo -u postgres psql -d dchat -c "UPDATE \"user\" SET role='super_admin' WHERE id=$USER1_ID;" 2>/dev/null
-ADMIN_TOKEN=$(go run /tmp/gen_jwt2.go "$USER1_ID" "dchat_local_test_jwt_secret_key_at_least_32_chars" "super_admin" 2>/dev/null)
+ADMIN_TOKEN=$(go run /tmp/gen_jwt.go "dchat_local_test_jwt_secret_key_at_least_32_chars" "super_admin" "$USER1_ID" 2>/dev/null)
 
 log_info "Admin dashboard stats"
 ADMIN_RES=$(auth_request GET "/api/admin/dashboard/stats" "" "$ADMIN_TOKEN")
-ADMIN_SUCCESS=$(echo "$ADMIN_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+ADMIN_SUCCESS=$(json_success "$ADMIN_RES")
 if [ "$ADMIN_SUCCESS" = "True" ]; then
   log_pass "Admin dashboard — Stats retrieved"
 else
@@ -683,7 +699,7 @@ fi
 
 log_info "Admin list users"
 ADMIN_USERS=$(auth_request GET "/api/admin/users" "" "$ADMIN_TOKEN")
-ADMIN_USERS_SUCCESS=$(echo "$ADMIN_USERS" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+ADMIN_USERS_SUCCESS=$(json_success "$ADMIN_USERS")
 if [ "$ADMIN_USERS_SUCCESS" = "True" ]; then
   log_pass "Admin list users — Users listed"
 else
@@ -692,7 +708,7 @@ fi
 
 log_info "Admin analytics - user growth"
 ANALYTICS_RES=$(auth_request GET "/api/admin/analytics/user-growth" "" "$ADMIN_TOKEN")
-ANALYTICS_SUCCESS=$(echo "$ANALYTICS_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+ANALYTICS_SUCCESS=$(json_success "$ANALYTICS_RES")
 if [ "$ANALYTICS_SUCCESS" = "True" ]; then
   log_pass "Analytics user growth — Data retrieved"
 else
@@ -707,7 +723,7 @@ log_info "Create report"
 RPT_RES=$(auth_request POST "/api/reports" \
   "{\"reported_user_id\": $USER2_ID, \"reason\": \"spam\", \"description\": \"Test report\"}" \
   "$TOKEN1")
-RPT_SUCCESS=$(echo "$RPT_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+RPT_SUCCESS=$(json_success "$RPT_RES")
 if [ "$RPT_SUCCESS" = "True" ]; then
   log_pass "Create report — Report submitted"
 else
@@ -722,7 +738,7 @@ log_info "Create meeting"
 MTG_RES=$(auth_request POST "/api/meetings" \
   "{\"title\": \"Test Meeting\", \"description\": \"Integration test meeting\"}" \
   "$TOKEN1")
-MTG_SUCCESS=$(echo "$MTG_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+MTG_SUCCESS=$(json_success "$MTG_RES")
 if [ "$MTG_SUCCESS" = "True" ]; then
   log_pass "Create meeting — Meeting created"
 else
@@ -731,7 +747,7 @@ fi
 
 log_info "List meetings"
 MTG_LIST=$(auth_request GET "/api/meetings" "" "$TOKEN1")
-MTG_LIST_SUCCESS=$(echo "$MTG_LIST" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+MTG_LIST_SUCCESS=$(json_success "$MTG_LIST")
 if [ "$MTG_LIST_SUCCESS" = "True" ]; then
   log_pass "List meetings — Meetings retrieved"
 else
@@ -746,7 +762,7 @@ log_info "Pin conversation"
 PIN_RES=$(auth_request POST "/api/conversations/pin" \
   "{\"target_id\": \"$USER2_ID\", \"target_type\": \"user\"}" \
   "$TOKEN1")
-PIN_SUCCESS=$(echo "$PIN_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+PIN_SUCCESS=$(json_success "$PIN_RES")
 if [ "$PIN_SUCCESS" = "True" ]; then
   log_pass "Pin conversation — Conversation pinned"
 else
@@ -755,7 +771,7 @@ fi
 
 log_info "Get pinned conversations"
 PINNED_RES=$(auth_request GET "/api/conversations/pinned" "" "$TOKEN1")
-PINNED_SUCCESS=$(echo "$PINNED_RES" | python3 -c "import sys,json; print(json.load(sys.stdin).get('success',False))" 2>/dev/null)
+PINNED_SUCCESS=$(json_success "$PINNED_RES")
 if [ "$PINNED_SUCCESS" = "True" ]; then
   log_pass "Get pinned — Pinned conversations retrieved"
 else
@@ -792,7 +808,9 @@ fi
 echo "================================================"
 
 # Save results to file
-echo "Test Results - $(date)" > /home/ubuntu/dchat/test_results.txt
-echo "Passed: $PASS" >> /home/ubuntu/dchat/test_results.txt
-echo "Failed: $FAIL" >> /home/ubuntu/dchat/test_results.txt
-echo "Total: $TOTAL" >> /home/ubuntu/dchat/test_results.txt
+{
+  echo "Test Results - $(date)"
+  echo "Passed: $PASS"
+  echo "Failed: $FAIL"
+  echo "Total: $TOTAL"
+} > /home/ubuntu/dchat/test_results.txt